@@ -1,96 +1,810 @@
+import contextlib
 import hashlib
+import heapq
+import io
+import json
+import mmap
+import multiprocessing
+import os
 import string
+import struct
+import sys
 import time
 
 
+# Tabela de digest-uri: antet (magic, număr de înregistrări, lungimea politicii JSON),
+# politica, apoi înregistrări de 16 octeți sortate: primii 8 octeți din SHA-256 și
+# indicele candidatului (big-endian, ca sortarea octeților să fie și sortarea numerică)
+TABLE_MAGIC = b"PWDTBL01"
+TABLE_HEADER = '<8sQQ'
+RECORD_SIZE = 16
+
+
 def get_hash(password):
     return hashlib.sha256(password.encode()).hexdigest()
 
 
+# Evenimentul de anulare partajat de procesele din pool (setat de _init_worker)
+_cancel_event = None
+
+
+def _init_worker(cancel_event):
+    global _cancel_event
+    _cancel_event = cancel_event
+
+
+def _search_prefix(task):
+    """Explorează subarborele unui prefix; rulează într-un proces din pool."""
+    settings, prefix = task
+    if _cancel_event.is_set():
+        return None, 0, 0, None, 0.0
+
+    start_time = time.time()
+    cracker = PasswordCracker(**settings)
+    target_hash = cracker.target_hash
+    cracker.cancel_event = _cancel_event
+    for _, password in cracker.search({bytes.fromhex(target_hash): target_hash}, prefix):
+        cracker.solution_found = True
+        cracker.solution = password
+        _cancel_event.set()
+    return (cracker.solution, cracker.recursive_calls, cracker.candidates_checked,
+            cracker.stats, time.time() - start_time)
+
+
+class SearchStats:
+    """Contoarele unei căutări, actualizate de backtrack, search și parallel_search.
+
+    depth_nodes[d] numără nodurile vizitate la adâncimea d (suma lor este
+    recursive_calls), hashes numără digest-urile SHA-256 calculate, iar rejected
+    ramurile și frunzele eliminate de politica de parolă. Cel mult o dată la
+    interval secunde se adaugă în samples o pereche (secunde, hashes) și se apelează
+    callback(stats), dacă a fost setat.
+    """
+
+    def __init__(self, password_length, interval=1.0):
+        self.depth_nodes = [0] * (password_length + 1)
+        self.hashes = 0
+        self.rejected = 0
+        self.interval = interval
+        self.callback = None
+        self.begin()
+
+    def begin(self):
+        self.started = self.last_sample = time.time()
+        self.samples = []
+
+    def sample(self):
+        self.last_sample = time.time()
+        self.samples.append((self.last_sample - self.started, self.hashes))
+        if self.callback is not None:
+            self.callback(self)
+
+    def maybe_sample(self):
+        if time.time() - self.last_sample >= self.interval:
+            self.sample()
+
+    def merge(self, other):
+        """Adună contoarele unei căutări făcute în alt proces."""
+        for depth, nodes in enumerate(other.depth_nodes):
+            self.depth_nodes[depth] += nodes
+        self.hashes += other.hashes
+        self.rejected += other.rejected
+
+    def hash_rates(self):
+        """Hash-uri pe secundă între eșantioane consecutive: listă de (secunde, rată)."""
+        rates = []
+        previous_time, previous_hashes = 0.0, 0
+        for elapsed, hashes in self.samples:
+            if elapsed > previous_time:
+                rates.append((elapsed, (hashes - previous_hashes) / (elapsed - previous_time)))
+            previous_time, previous_hashes = elapsed, hashes
+        return rates
+
+    def as_dict(self):
+        return {
+            'depth_nodes': list(self.depth_nodes),
+            'hashes': self.hashes,
+            'rejected': self.rejected,
+            'hash_rates': self.hash_rates(),
+        }
+
+
 class PasswordCracker:
-    def __init__(self, target_hash):
+    def __init__(self, target_hash, password_length=6, uppercase_letters=None, lowercase_letters=None,
+                 digits=None, special_chars=None, min_counts=(1, 3, 1, 1), max_counts=None):
         self.target_hash = target_hash
-        self.password_length = 6
-        self.uppercase_letters = list(string.ascii_uppercase)  # A-Z
-        self.lowercase_letters = list(string.ascii_lowercase)  # a-z
-        self.digits = list(string.digits)  # 0-9
-        self.special_chars = ['!', '@', '#', '$']
+        self.password_length = password_length
+        self.uppercase_letters = list(uppercase_letters or string.ascii_uppercase)  # A-Z
+        self.lowercase_letters = list(lowercase_letters or string.ascii_lowercase)  # a-z
+        self.digits = list(digits or string.digits)  # 0-9
+        self.special_chars = list(special_chars or ['!', '@', '#', '$'])
+        # Politica de parolă: câte caractere din fiecare clasă (mari, mici, cifre, speciale)
+        # sunt obligatorii și câte sunt permise; implicit exact 1, 3, 1 și 1
+        self.min_counts = tuple(min_counts)
+        self.max_counts = tuple(max_counts) if max_counts is not None else self.min_counts
+        if not sum(self.min_counts) <= password_length <= sum(self.max_counts):
+            raise ValueError(f"Politica de parolă nu permite parole de lungime {password_length}: "
+                             f"minimele însumează {sum(self.min_counts)}, maximele {sum(self.max_counts)}")
         self.recursive_calls = 0
         self.solution_found = False
         self.solution = None
+        self.candidates_checked = 0
+        # Folosite în modul paralel: un worker se oprește când alt worker a găsit parola
+        self.cancel_event = None
+        self.cancelled = False
+        self._leaf_counts = {}
+        self._children = {}
+        self.stats = SearchStats(password_length)
+
+    def class_counts(self, chars):
+        """Numărul de litere mari, litere mici, cifre și caractere speciale din chars."""
+        return (sum(c in self.uppercase_letters for c in chars),
+                sum(c in self.lowercase_letters for c in chars),
+                sum(c in self.digits for c in chars),
+                sum(c in self.special_chars for c in chars))
+
+    def settings(self):
+        """Argumentele constructorului, ca să refacem același cracker într-un alt proces."""
+        return dict(target_hash=self.target_hash, password_length=self.password_length,
+                    uppercase_letters=self.uppercase_letters, lowercase_letters=self.lowercase_letters,
+                    digits=self.digits, special_chars=self.special_chars,
+                    min_counts=self.min_counts, max_counts=self.max_counts)
+
+    def policy(self):
+        """Politica de parolă, în forma salvată în tabele și checkpoint-uri."""
+        settings = self.settings()
+        del settings['target_hash']
+        return json.loads(json.dumps(settings))
+
+    def charsets(self):
+        return (self.uppercase_letters, self.lowercase_letters, self.digits, self.special_chars)
+
+    def missing(self, counts):
+        """Câte caractere mai lipsesc ca să fie atinse minimele fiecărei clase."""
+        return sum(max(0, need - have) for need, have in zip(self.min_counts, counts))
+
+    def feasible_classes(self, counts):
+        """Clasele care pot ocupa poziția următoare fără ca prefixul să devină imposibil.
+
+        O clasă este acceptată dacă nu i-am atins maximul și dacă, după adăugare,
+        caracterele obligatorii care lipsesc încap în pozițiile rămase, iar
+        maximele claselor permit încă umplerea acestor poziții.
+        """
+        remaining = self.password_length - sum(counts) - 1
+        missing = self.missing(counts)
+        # Câte caractere mai permit maximele, înainte de adăugare
+        capacity = sum(limit - have for have, limit in zip(counts, self.max_counts))
+        for i in range(4):
+            if (counts[i] < self.max_counts[i] and missing - (counts[i] < self.min_counts[i]) <= remaining
+                    and capacity - 1 >= remaining):
+                yield i, counts[:i] + (counts[i] + 1,) + counts[i + 1:]
+
+    def children(self, counts):
+        """feasible_classes(counts) ca listă, plus numărul de clase eliminate de politică.
+
+        Rezultatul depinde doar de counts, deci îl păstrăm: backtrack îl cere la
+        fiecare nod interior, iar numărul de stări distincte este foarte mic.
+        """
+        if counts not in self._children:
+            feasible = list(self.feasible_classes(counts))
+            below_max = sum(have < limit for have, limit in zip(counts, self.max_counts))
+            self._children[counts] = feasible, below_max - len(feasible)
+        return self._children[counts]
+
+    def prefixes(self, depth, current_password=(), counts=(0, 0, 0, 0)):
+        """Prefixele valide de lungime depth, în ordinea în care le vizitează backtrack."""
+        if len(current_password) == depth:
+            yield tuple(current_password)
+            return
+        classes = self.charsets()
+        for i, new_counts in self.feasible_classes(counts):
+            for char in classes[i]:
+                yield from self.prefixes(depth, current_password + (char,), new_counts)
+
+    def templates(self, template=(), counts=(0, 0, 0, 0)):
+        """Șabloanele de clase pe poziții care respectă politica (120 pentru cea implicită).
+
+        Fiecare șablon este un tuplu cu indicele clasei pentru fiecare poziție; căutarea
+        vizitează doar prefixe ale acestor șabloane.
+        """
+        if len(template) == self.password_length:
+            yield template
+            return
+        for i, new_counts in self.feasible_classes(counts):
+            yield from self.templates(template + (i,), new_counts)
+
+    def tree_size(self, prune=True):
+        """Numărul de noduri din arborele de căutare, calculat fără să-l parcurgem.
+
+        Cu prune=False numără arborele vechi, care limita doar maximul fiecărei clase
+        și verifica politica abia la lungimea completă.
+        """
+        sizes = (len(self.uppercase_letters), len(self.lowercase_letters),
+                 len(self.digits), len(self.special_chars))
+        memo = {}
+
+        def nodes(counts):
+            if counts not in memo:
+                total = 1
+                if sum(counts) < self.password_length:
+                    if prune:
+                        children = self.feasible_classes(counts)
+                    else:
+                        children = ((i, counts[:i] + (counts[i] + 1,) + counts[i + 1:])
+                                    for i in range(4) if counts[i] < self.max_counts[i])
+                    for i, new_counts in children:
+                        total += sizes[i] * nodes(new_counts)
+                memo[counts] = total
+            return memo[counts]
+
+        return nodes((0, 0, 0, 0))
+
+    def leaf_count(self, counts=(0, 0, 0, 0)):
+        """Numărul de candidați din subarborele unui nod cu numărătorile counts."""
+        if counts not in self._leaf_counts:
+            if sum(counts) == self.password_length:
+                total = 1 if self.missing(counts) == 0 else 0
+            else:
+                classes = self.charsets()
+                total = sum(len(classes[i]) * self.leaf_count(new_counts)
+                            for i, new_counts in self.feasible_classes(counts))
+            self._leaf_counts[counts] = total
+        return self._leaf_counts[counts]
+
+    def unrank(self, index):
+        """Candidatul cu numărul index, în ordinea în care îi vizitează căutarea."""
+        if not 0 <= index < self.leaf_count():
+            raise IndexError(f"Candidatul {index} nu există")
+        classes = self.charsets()
+        counts = (0, 0, 0, 0)
+        password = []
+        for _ in range(self.password_length):
+            for i, new_counts in self.feasible_classes(counts):
+                block = self.leaf_count(new_counts)
+                size = len(classes[i]) * block
+                if index < size:
+                    password.append(classes[i][index // block])
+                    index %= block
+                    counts = new_counts
+                    break
+                index -= size
+        return ''.join(password)
+
+    def rank(self, password):
+        """Inversa lui unrank: numărul de ordine al unei parole care respectă politica."""
+        if len(password) != self.password_length:
+            raise ValueError(f"{password!r} nu are {self.password_length} caractere")
+        classes = self.charsets()
+        counts = (0, 0, 0, 0)
+        index = 0
+        for char in password:
+            for i, new_counts in self.feasible_classes(counts):
+                if char in classes[i]:
+                    index += classes[i].index(char) * self.leaf_count(new_counts)
+                    counts = new_counts
+                    break
+                index += len(classes[i]) * self.leaf_count(new_counts)
+            else:
+                raise ValueError(f"{password!r} nu respectă politica de parolă")
+        return index
 
     def backtrack(self, current_password, uppercase_count, lowercase_count, digit_count, special_count):
 
         self.recursive_calls += 1
+        self.stats.depth_nodes[len(current_password)] += 1
 
+        # Verificăm rar evenimentul de anulare și eșantionăm, ca să nu încetinim căutarea
+        if self.recursive_calls % 16384 == 0:
+            self.stats.maybe_sample()
+            if self.cancel_event is not None and self.cancel_event.is_set():
+                self.cancelled = True
 
-        if self.solution_found:
+        if self.solution_found or self.cancelled:
             return
 
 
         if len(current_password) == self.password_length:
 
-            if (uppercase_count == 1 and lowercase_count == 3 and
-                    digit_count == 1 and special_count == 1):
-
+            mins = self.min_counts
+            if (uppercase_count >= mins[0] and lowercase_count >= mins[1] and
+                    digit_count >= mins[2] and special_count >= mins[3]):
+                self.candidates_checked += 1
+                self.stats.hashes += 1
                 password_str = ''.join(current_password)
                 if get_hash(password_str) == self.target_hash:
                     self.solution_found = True
                     self.solution = password_str
+            else:
+                self.stats.rejected += 1
             return
 
-
-        if uppercase_count < 1:
-            for char in self.uppercase_letters:
+        # Ramurile care nu mai pot respecta politica nu sunt explorate deloc
+        children, rejected = self.children((uppercase_count, lowercase_count, digit_count, special_count))
+        self.stats.rejected += rejected
+        classes = self.charsets()
+        for i, new_counts in children:
+            for char in classes[i]:
                 current_password.append(char)
-                self.backtrack(current_password, uppercase_count + 1, lowercase_count, digit_count, special_count)
-                if self.solution_found:
+                self.backtrack(current_password, *new_counts)
+                if self.solution_found or self.cancelled:
                     return
                 current_password.pop()
 
-        # Try adding a lowercase letter
-        if lowercase_count < 3:
-            for char in self.lowercase_letters:
-                current_password.append(char)
-                self.backtrack(current_password, uppercase_count, lowercase_count + 1, digit_count, special_count)
-                if self.solution_found:
-                    return
-                current_password.pop()
+    def search(self, targets, prefix=(), start=0, checkpoint=None, checkpoint_interval=30.0):
+        """Varianta iterativă a lui backtrack, fără recursivitate și fără șiruri intermediare.
 
+        targets este un dicționar digest SHA-256 (bytes) -> hash hex; fiecare potrivire
+        este scoasă din dicționar și generată ca (hash, parolă), iar căutarea se oprește
+        când dicționarul se golește. Candidatul stă într-un bytearray prealocat, iar
+        pentru fiecare adâncime păstrăm obiectul sha256 actualizat cu prefixul, așa că
+        o frunză costă doar copy() + update() cu un octet. Explorarea pornește de la
+        prefix și vizitează nodurile în aceeași ordine ca backtrack, deci
+        recursive_calls și candidates_checked au aceleași valori.
 
-        if digit_count < 1:
-            for char in self.digits:
-                current_password.append(char)
-                self.backtrack(current_password, uppercase_count, lowercase_count, digit_count + 1, special_count)
-                if self.solution_found:
-                    return
-                current_password.pop()
+        Cu start > 0 căutarea reia tot arborele de la candidatul cu acel număr (vezi
+        unrank). Dacă checkpoint este o cale, poziția, contoarele și țintele rămase
+        sunt scrise acolo cel mult o dată la checkpoint_interval secunde; fișierul este
+        șters când căutarea se termină, iar resume() continuă de la ultima salvare.
+        """
+        if start and prefix:
+            raise ValueError("start se poate folosi doar pentru tot arborele")
+        n = self.password_length
+        mins, maxs = self.min_counts, self.max_counts
+        charsets = [[c.encode() for c in chars] for chars in self.charsets()]
+        counts = list(self.class_counts(prefix))
+        missing = self.missing(counts)
+        top = len(prefix)
 
+        password = bytearray(n)
+        password[:top] = ''.join(prefix).encode()
+        states = [None] * (n + 1)
+        states[top] = hashlib.sha256(password[:top])
+        class_index = [0] * (n + 1)
+        char_index = [0] * (n + 1)
 
-        if special_count < 1:
-            for char in self.special_chars:
-                current_password.append(char)
-                self.backtrack(current_password, uppercase_count, lowercase_count, digit_count, special_count + 1)
-                if self.solution_found:
-                    return
-                current_password.pop()
+        calls = self.recursive_calls + (0 if start else 1)
+        candidates = self.candidates_checked
+        next_check = calls + 16384
+
+        # Contoarele din stats se actualizează doar în sync(), nu la fiecare frunză
+        stats = self.stats
+        depth_nodes = stats.depth_nodes
+        synced = candidates
+        rejected = 0
+        if not start and top < n:
+            depth_nodes[top] += 1
+
+        def sync():
+            nonlocal synced, rejected
+            self.recursive_calls, self.candidates_checked = calls, candidates
+            depth_nodes[n] += candidates - synced
+            stats.hashes += candidates - synced
+            stats.rejected += rejected
+            synced, rejected = candidates, 0
+        next_save = time.time() + checkpoint_interval
+        first_class = first_char = 0
+        depth = top
+        if start:
+            if start >= self.leaf_count():
+                self._remove_checkpoint(checkpoint)
+                return
+            # Refacem stiva pe drumul spre candidatul start; nodurile interioare care nu
+            # erau pe drumul candidatului anterior sunt vizitate acum pentru prima dată
+            resumed, previous = self.unrank(start), self.unrank(start - 1)
+            common = next(d for d in range(n) if resumed[d] != previous[d])
+            calls += n - 1 - common
+            for depth in range(common + 1, n):
+                depth_nodes[depth] += 1
+            for depth, char in enumerate(resumed):
+                c = self.class_counts(char).index(1)
+                i = charsets[c].index(char.encode())
+                if depth == n - 1:
+                    first_class, first_char = c, i
+                    break
+                class_index[depth], char_index[depth] = c, i + 1
+                password[depth:depth + 1] = charsets[c][i]
+                states[depth + 1] = states[depth].copy()
+                states[depth + 1].update(charsets[c][i])
+                missing -= counts[c] < mins[c]
+                counts[c] += 1
+        elif top == n:
+            # Prefixul este deja o parolă completă
+            candidates += 1
+            digest = states[n].digest()
+            sync()
+            if digest in targets:
+                yield targets.pop(digest), password.decode()
+            return
+
+        while depth >= top:
+            if depth == n - 1:
+                # Ultima poziție: parcurgem frunzele direct, fără să coborâm în stivă
+                state = states[depth]
+                for c in range(first_class, 4):
+                    if counts[c] >= maxs[c]:
+                        continue
+                    if missing - (counts[c] < mins[c]) > 0:
+                        rejected += 1
+                        continue
+                    chars = charsets[c][first_char:] if first_char else charsets[c]
+                    first_char = 0
+                    for char in chars:
+                        calls += 1
+                        candidates += 1
+                        leaf = state.copy()
+                        leaf.update(char)
+                        digest = leaf.digest()
+                        if digest in targets:
+                            password[depth:] = char
+                            sync()
+                            yield targets.pop(digest), password.decode()
+                            if not targets:
+                                self._remove_checkpoint(checkpoint)
+                                return
+                first_class = 0
+                depth -= 1
+                if depth >= top:
+                    c = class_index[depth]
+                    counts[c] -= 1
+                    missing += counts[c] < mins[c]
+                if calls >= next_check:
+                    next_check = calls + 16384
+                    sync()
+                    stats.maybe_sample()
+                    if self.cancel_event is not None and self.cancel_event.is_set():
+                        self.cancelled = True
+                        break
+                    if checkpoint is not None and time.time() >= next_save:
+                        self.save_checkpoint(checkpoint, candidates, calls, targets)
+                        next_save = time.time() + checkpoint_interval
+                continue
+
+            # Sărim peste clasele epuizate sau care ar lăsa prea puține poziții pentru minime
+            c, i = class_index[depth], char_index[depth]
+            remaining = n - depth - 1
+            while c < 4:
+                if counts[c] < maxs[c] and i < len(charsets[c]):
+                    if missing - (counts[c] < mins[c]) <= remaining:
+                        break
+                    rejected += 1
+                c, i = c + 1, 0
+            if c == 4:
+                depth -= 1
+                if depth >= top:
+                    c = class_index[depth]
+                    counts[c] -= 1
+                    missing += counts[c] < mins[c]
+                continue
+
+            char = charsets[c][i]
+            class_index[depth], char_index[depth] = c, i + 1
+            password[depth:depth + 1] = char
+            state = states[depth].copy()
+            state.update(char)
+            calls += 1
+            missing -= counts[c] < mins[c]
+            counts[c] += 1
+            depth += 1
+            depth_nodes[depth] += 1
+            states[depth] = state
+            class_index[depth], char_index[depth] = 0, 0
+
+        sync()
+        if not self.cancelled:
+            self._remove_checkpoint(checkpoint)
+
+    def save_checkpoint(self, path, candidate, calls, targets):
+        """Scrie poziția căutării; fișierul se înlocuiește atomic, deci nu rămâne pe jumătate."""
+        state = {
+            'policy': self.policy(),
+            'candidate': candidate,
+            'recursive_calls': calls,
+            'targets': sorted(targets.values()),
+        }
+        with open(path + '.tmp', 'w') as f:
+            json.dump(state, f)
+        os.replace(path + '.tmp', path)
+
+    def _remove_checkpoint(self, path):
+        if path is not None and os.path.exists(path):
+            os.remove(path)
+
+    def resume(self, path, checkpoint_interval=30.0):
+        """Continuă o căutare întreruptă de la ultimul checkpoint salvat în path."""
+        with open(path) as f:
+            state = json.load(f)
+        if state['policy'] != self.policy():
+            raise ValueError(f"{path} a fost scris pentru altă politică de parolă")
+        self.recursive_calls = state['recursive_calls']
+        self.candidates_checked = state['candidate']
+        targets = {bytes.fromhex(h): h for h in state['targets']}
+        return self.search(targets, start=state['candidate'], checkpoint=path,
+                           checkpoint_interval=checkpoint_interval)
+
+    def leaf_digests(self):
+        """Digest-urile SHA-256 ale tuturor candidaților, în ordinea numerelor lor."""
+        sha256 = hashlib.sha256
+        charsets = [[c.encode() for c in chars] for chars in self.charsets()]
+        for prefix in self.prefixes(self.password_length - 1):
+            state = sha256(''.join(prefix).encode())
+            for i, _ in self.feasible_classes(self.class_counts(prefix)):
+                for char in charsets[i]:
+                    leaf = state.copy()
+                    leaf.update(char)
+                    yield leaf.digest()
+
+    def build_table(self, path, run_size=1 << 22):
+        """Construiește tabela sortată de digest-uri, deschisă apoi cu DigestTable.
+
+        Înregistrările se sortează în memorie câte run_size o dată și se scriu în
+        fișiere temporare, care sunt apoi interclasate (sortare externă), deci memoria
+        nu depinde de mărimea spațiului. Pentru politica implicită sunt aproape 2,2
+        miliarde de candidați, adică un fișier de circa 35 GB.
+        """
+        policy = json.dumps(self.policy()).encode()
+        policy += b' ' * (-(struct.calcsize(TABLE_HEADER) + len(policy)) % RECORD_SIZE)
+        runs = []
+        records = []
+        for index, digest in enumerate(self.leaf_digests()):
+            records.append(digest[:8] + index.to_bytes(8, 'big'))
+            if len(records) == run_size:
+                runs.append(self._write_run(path, len(runs), records))
+                records = []
+        if records or not runs:
+            runs.append(self._write_run(path, len(runs), records))
+        count = sum(os.path.getsize(run) for run in runs) // RECORD_SIZE
+
+        files = [open(run, 'rb') for run in runs]
+        try:
+            with open(path + '.tmp', 'wb') as out:
+                out.write(struct.pack(TABLE_HEADER, TABLE_MAGIC, count, len(policy)))
+                out.write(policy)
+                buffer = []
+                for record in heapq.merge(*(self._read_run(f) for f in files)):
+                    buffer.append(record)
+                    if len(buffer) == 65536:
+                        out.write(b''.join(buffer))
+                        buffer = []
+                out.write(b''.join(buffer))
+        finally:
+            for f in files:
+                f.close()
+            for run in runs:
+                os.remove(run)
+        os.replace(path + '.tmp', path)
+        return count
+
+    @staticmethod
+    def _write_run(path, number, records):
+        records.sort()
+        run = f"{path}.run{number}"
+        with open(run, 'wb') as f:
+            f.write(b''.join(records))
+        return run
+
+    @staticmethod
+    def _read_run(f):
+        while True:
+            block = f.read(RECORD_SIZE * 65536)
+            if not block:
+                return
+            for offset in range(0, len(block), RECORD_SIZE):
+                yield block[offset:offset + RECORD_SIZE]
+
+    def lookup(self, table):
+        """Caută target_hash într-o DigestTable: căutare binară plus un singur hash de verificare."""
+        if table.policy != self.policy():
+            raise ValueError(f"{table.path} a fost construită pentru altă politică de parolă")
+        for index in table.find(bytes.fromhex(self.target_hash)):
+            self.candidates_checked += 1
+            self.stats.hashes += 1
+            password = self.unrank(index)
+            if get_hash(password) == self.target_hash:
+                return password
+        return None
+
+    def parallel_search(self, processes=None, split_depth=2):
+        """Împarte arborele după primele split_depth poziții și îl caută pe un pool de procese.
 
-    def find_password(self):
+        Fiecare prefix este o sarcină separată. Când un worker găsește parola setează
+        un eveniment partajat, iar ceilalți se opresc la următoarea verificare.
+        recursive_calls devine suma apelurilor tuturor worker-ilor plus nodurile de
+        deasupra adâncimii de împărțire; returnează timpul cumulat al worker-ilor.
+        """
+        self.recursive_calls = 0
+        for depth in range(split_depth):
+            nodes = sum(1 for _ in self.prefixes(depth))
+            self.stats.depth_nodes[depth] += nodes
+            self.recursive_calls += nodes
+        worker_time = 0.0
+        cancel_event = multiprocessing.Event()
+        settings = self.settings()
+        tasks = ((settings, prefix) for prefix in self.prefixes(split_depth))
+
+        with multiprocessing.Pool(processes, initializer=_init_worker, initargs=(cancel_event,)) as pool:
+            for solution, calls, candidates, stats, elapsed in pool.imap_unordered(_search_prefix, tasks, chunksize=4):
+                self.recursive_calls += calls
+                self.candidates_checked += candidates
+                if stats is not None:
+                    self.stats.merge(stats)
+                    self.stats.maybe_sample()
+                worker_time += elapsed
+                if solution is not None and not self.solution_found:
+                    self.solution_found = True
+                    self.solution = solution
+        return worker_time
+
+    def audit(self, target_hashes):
+        """Caută mai multe hash-uri dintr-o singură parcurgere a spațiului de parole.
+
+        Digest-urile țintă stau într-un dicționar, deci fiecare candidat costă un singur
+        SHA-256 și o căutare O(1). Generează perechi (hash, parolă) pe măsură ce le
+        găsește și se oprește imediat ce toate țintele au fost rezolvate.
+        """
+        remaining = {bytes.fromhex(h): h for h in target_hashes}
+        if remaining:
+            yield from self.search(remaining)
+
+    def find_password(self, parallel=False, processes=None, recursive=False, table=None, checkpoint=None):
+        """Caută target_hash cu varianta aleasă, afișează rezultatul și returnează self.stats."""
         start_time = time.time()
-        self.backtrack([], 0, 0, 0, 0)
+        self.stats.begin()
+        if parallel:
+            worker_time = self.parallel_search(processes)
+        elif recursive:
+            self.backtrack([], 0, 0, 0, 0)
+        elif table is not None:
+            with DigestTable(table) as digest_table:
+                self.solution = self.lookup(digest_table)
+            self.solution_found = self.solution is not None
+        else:
+            if checkpoint is not None and os.path.exists(checkpoint):
+                matches = self.resume(checkpoint)
+            else:
+                targets = {bytes.fromhex(self.target_hash): self.target_hash}
+                matches = self.search(targets, checkpoint=checkpoint)
+            for _, password in matches:
+                self.solution_found = True
+                self.solution = password
         end_time = time.time()
+        elapsed = end_time - start_time
+        self.stats.sample()
 
         if self.solution_found:
             print(f"Parola găsită: {self.solution}")
             print(f"Număr apeluri recursive: {self.recursive_calls}")
-            print(f"Timp de execuție: {end_time - start_time:.2f} secunde")
+            print(f"Noduri în arbore: {self.tree_size():,} (fără tăiere: {self.tree_size(prune=False):,})")
+            print(f"Timp de execuție: {elapsed:.2f} secunde")
+            if elapsed > 0:
+                print(f"Candidați pe secundă: {self.candidates_checked / elapsed:,.0f}")
+            if parallel:
+                print(f"Timp cumulat în procese: {worker_time:.2f} secunde")
         else:
             print("Parola nu a fost găsită.")
+        return self.stats
+
+
+class DigestTable:
+    """Tabelă de digest-uri scrisă de PasswordCracker.build_table, deschisă prin mmap.
+
+    Deschiderea citește doar antetul și politica; căutarea face o căutare binară
+    direct în fișierul mapat, deci tabela nu trebuie încărcată în memorie.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.file = open(path, 'rb')
+        self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, self.count, policy_length = struct.unpack_from(TABLE_HEADER, self.map)
+        if magic != TABLE_MAGIC:
+            self.close()
+            raise ValueError(f"{path} nu este o tabelă de digest-uri")
+        self.start = struct.calcsize(TABLE_HEADER) + policy_length
+        self.policy = json.loads(self.map[struct.calcsize(TABLE_HEADER):self.start])
+
+    def find(self, digest):
+        """Numerele candidaților ai căror digest începe cu aceiași 8 octeți ca digest."""
+        key = digest[:8]
+        low, high = 0, self.count
+        while low < high:
+            middle = (low + high) // 2
+            offset = self.start + middle * RECORD_SIZE
+            if self.map[offset:offset + 8] < key:
+                low = middle + 1
+            else:
+                high = middle
+        indexes = []
+        offset = self.start + low * RECORD_SIZE
+        while offset < len(self.map) and self.map[offset:offset + 8] == key:
+            indexes.append(int.from_bytes(self.map[offset + 8:offset + RECORD_SIZE], 'big'))
+            offset += RECORD_SIZE
+        return indexes
+
+    def close(self):
+        self.map.close()
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# Politica redusă din benchmark: aceeași structură ca cea implicită, cu 933.120 de candidați
+BENCHMARK_POLICY = dict(uppercase_letters="ABCDEF", lowercase_letters="abcdef", digits="012", special_chars="!@")
+
+
+def run_benchmark(variants=('recursive', 'iterative', 'parallel'), positions=('start', 'middle', 'end'),
+                  policy=None, processes=None, results_file="benchmark_backtracking.json"):
+    """Compară variantele căutării pe ținte aflate la începutul, mijlocul și finalul ordinii.
+
+    Ținta pentru fiecare poziție este candidatul cu numărul 0, count // 2 sau
+    count - 1 (vezi unrank), deci toate variantele parcurg exact aceeași porțiune
+    din arbore. Pentru fiecare rulare se salvează timpul, contoarele și statisticile
+    SearchStats în results_file (JSON).
+    """
+    import platform
+
+    policy = dict(BENCHMARK_POLICY if policy is None else policy)
+    count = PasswordCracker(None, **policy).leaf_count()
+    indexes = {'start': 0, 'middle': count // 2, 'end': count - 1}
+
+    results = []
+    for position in positions:
+        password = PasswordCracker(None, **policy).unrank(indexes[position])
+        for variant in variants:
+            cracker = PasswordCracker(get_hash(password), **policy)
+            options = {'recursive': dict(recursive=True), 'iterative': {},
+                       'parallel': dict(parallel=True, processes=processes)}[variant]
+            start_time = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                stats = cracker.find_password(**options)
+            elapsed = time.perf_counter() - start_time
+            if cracker.solution != password:
+                raise RuntimeError(f"{variant} nu a găsit parola {password!r}")
 
+            # Ținta 'start' se găsește în câteva microsecunde; pe un ceas grosier elapsed poate fi 0
+            hashes_per_second = stats.hashes / elapsed if elapsed > 0 else None
+            print(f"Benchmark: {variant}, {position} ({indexes[position]}): {elapsed:.4f} secunde, "
+                  + (f"{hashes_per_second:,.0f} hash-uri/secundă" if hashes_per_second is not None
+                     else "prea rapid pentru a măsura debitul"))
+            results.append({
+                'variant': variant,
+                'position': position,
+                'index': indexes[position],
+                'password': password,
+                'seconds': elapsed,
+                'recursive_calls': cracker.recursive_calls,
+                'candidates_checked': cracker.candidates_checked,
+                'hashes_per_second': hashes_per_second,
+                'stats': stats.as_dict(),
+            })
 
+    report = {
+        'metadata': {
+            'date': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+            'processes': processes,
+            'policy': policy,
+            'candidates': count,
+        },
+        'results': results,
+    }
+    with open(results_file, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    print(f"Rezultatele benchmark-ului au fost salvate în {results_file}")
+    return report
 
-target_hash = "0e000d61c1735636f56154f30046be93b3d71f1abbac3cd9e3f80093fdb357ad"
 
+if __name__ == "__main__" and sys.argv[1:2] == ["benchmark"]:
+    # python backtracking.py benchmark [rezultate.json]
+    run_benchmark(results_file=sys.argv[2] if len(sys.argv) > 2 else "benchmark_backtracking.json")
+elif __name__ == "__main__":
+    target_hash = "0e000d61c1735636f56154f30046be93b3d71f1abbac3cd9e3f80093fdb357ad"
 
-cracker = PasswordCracker(target_hash)
-cracker.find_password()
\ No newline at end of file
+    cracker = PasswordCracker(target_hash)
+    cracker.find_password()
\ No newline at end of file
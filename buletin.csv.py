@@ -1,65 +1,1038 @@
 import random
 import csv
+import json
+import math
+import mmap
+import os
+import struct
+import sys
 import time
+import zlib
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import Counter
+
+try:
+    import numpy as np
+except ImportError:  # NumPy este opțional: fără el se folosesc variantele scalare
+    np = None
+
+DIMENSIUNE_INITIALA = 1024
+
+# Formatul fișierului index: antet fix, apoi secțiunile aliniate la 8 octeți
+MAGIC_INDEX = b"CNPIDX01"
+FORMAT_ANTET_INDEX = '<8sQQQ'  # magic, număr bucket-uri, număr înregistrări, lungime blob nume
+DIMENSIUNE_ANTET_INDEX = 64
 
 
 class HashTable:
-    def init(self, size):
+    """Tabelă hash cu înlănțuire pentru CNP-uri.
+
+    Când numărul de elemente depășește factor_incarcare_maxim * dimensiune, tabela
+    își dublează capacitatea. Ca în Redis, rehash-ul este incremental: cât timp
+    există două tabele, fiecare inserare mută încă bucket_uri_per_pas lanțuri din
+    tabela veche în cea nouă, iar căutările le consultă pe amândouă. Lanțurile se
+    creează abia la prima inserare în bucket (un bucket gol este None), astfel că
+    alocarea tabelei noi nu blochează inserarea care declanșează redimensionarea.
+    """
+
+    def __init__(self, size=DIMENSIUNE_INITIALA, factor_incarcare_maxim=1.0, bucket_uri_per_pas=4):
         self.size = size
-        self.table = [[] for _ in range(size)]
+        self.table = [None] * size
+        self.factor_incarcare_maxim = factor_incarcare_maxim
+        self.bucket_uri_per_pas = bucket_uri_per_pas
+        # Starea rehash-ului incremental; table_noua este None în afara unei redimensionări
+        self.table_noua = None
+        self.size_nou = 0
+        self.index_rehash = 0
+        self.resize_uri = 0
+        self.timp_migrare = 0.0
+        self.numar_elemente = 0
         self.coliziuni = 0
         self.lungime_maxima_lant = 0
+        self.index_prefix = None
+        self.timp_index_prefix = 0.0
 
-    def functie_hash(self, cheie):
+    def functie_hash(self, cheie, dimensiune=None):
         """Funcție de hash personalizată pentru CNP-uri"""
+        if dimensiune is None:
+            dimensiune = self.size
         valoare_hash = 0
         for caracter in cheie:
             # Folosim un multiplicator prim pentru o distribuție mai bună
-            valoare_hash = (valoare_hash * 31 + ord(caracter)) % self.size
+            valoare_hash = (valoare_hash * 31 + ord(caracter)) % dimensiune
         return valoare_hash
 
+    def functie_hash_lot(self, cnp_uri, dimensiune=None):
+        """Calculează functie_hash pentru toate CNP-urile dintr-o singură trecere vectorizată.
+
+        CNP-urile sunt transformate într-o matrice uint8 (o linie per cheie), iar
+        hash-ul polinomial-31 se aplică pe coloane, cu același modulo la fiecare pas,
+        deci indicii sunt identici cu cei din varianta scalară (pentru chei ASCII).
+        """
+        if dimensiune is None:
+            dimensiune = self.size
+        if np is None:
+            return [self.functie_hash(cnp, dimensiune) for cnp in cnp_uri]
+
+        chei = np.asarray(cnp_uri, dtype=bytes)
+        latime = chei.dtype.itemsize
+        caractere = chei.view(np.uint8).reshape(len(chei), latime)
+        lungimi = np.char.str_len(chei)
+        lungimi_egale = bool((lungimi == latime).all())
+
+        valori_hash = np.zeros(len(chei), dtype=np.uint64)
+        for j in range(latime):
+            pas = (valori_hash * 31 + caractere[:, j]) % dimensiune
+            # Cheile mai scurte sunt completate cu zero: nu le aplicăm acele coloane
+            valori_hash = pas if lungimi_egale else np.where(j < lungimi, pas, valori_hash)
+        return valori_hash.tolist()
+
+    def _tabela_activa(self):
+        """Tabela în care ajung inserările: cea nouă, dacă un rehash este în curs"""
+        if self.table_noua is not None:
+            return self.table_noua, self.size_nou
+        return self.table, self.size
+
     def inserare(self, cnp, nume):
         """Inserează o pereche CNP-nume în tabela hash"""
-        index = self.functie_hash(cnp)
+        if self.table_noua is not None:
+            self._pas_rehash(self.bucket_uri_per_pas)
+        tabela, dimensiune = self._tabela_activa()
+        index = self.functie_hash(cnp, dimensiune)
 
         # Verificăm dacă este o coliziune
-        if len(self.table[index]) > 0:
+        lant = tabela[index]
+        if lant is None:
+            tabela[index] = lant = []
+        else:
             self.coliziuni += 1
 
         # Adăugăm în lanțul de la acest index
-        self.table[index].append((cnp, nume))
+        lant.append((cnp, nume))
+        self.numar_elemente += 1
 
         # Actualizăm lungimea maximă a lanțului
-        lungime_lant = len(self.table[index])
-        if lungime_lant > self.lungime_maxima_lant:
-            self.lungime_maxima_lant = lungime_lant
+        if len(lant) > self.lungime_maxima_lant:
+            self.lungime_maxima_lant = len(lant)
+
+        self._verifica_redimensionare()
+        if self.index_prefix is not None:
+            self.index_prefix.adauga([cnp])
+
+    def inserare_lot(self, cnp_uri, nume_uri):
+        """Inserează în bloc perechile CNP-nume, cu hash-urile calculate vectorizat.
+
+        Lotul este împărțit în bucăți care nu trec de pragul de redimensionare, ca
+        fiecare bucată să fie hash-uită pentru tabela în care va ajunge efectiv.
+        """
+        inceput = 0
+        while inceput < len(cnp_uri):
+            sfarsit = len(cnp_uri)
+            if self.factor_incarcare_maxim is not None:
+                _, dimensiune = self._tabela_activa()
+                loc_pana_la_prag = int(self.factor_incarcare_maxim * dimensiune) - self.numar_elemente + 1
+                sfarsit = min(sfarsit, inceput + max(loc_pana_la_prag, 1))
+            bucata_cnp = cnp_uri[inceput:sfarsit]
+            bucata_nume = nume_uri[inceput:sfarsit]
+
+            if self.table_noua is not None:
+                self._pas_rehash(len(bucata_cnp) * self.bucket_uri_per_pas)
+            tabela, dimensiune = self._tabela_activa()
+            coliziuni = 0
+            lungime_maxima_lant = self.lungime_maxima_lant
+
+            for index, cnp, nume in zip(self.functie_hash_lot(bucata_cnp, dimensiune), bucata_cnp, bucata_nume):
+                lant = tabela[index]
+                if lant is None:
+                    tabela[index] = lant = []
+                else:
+                    coliziuni += 1
+                lant.append((cnp, nume))
+                if len(lant) > lungime_maxima_lant:
+                    lungime_maxima_lant = len(lant)
+
+            self.numar_elemente += len(bucata_cnp)
+            self.coliziuni += coliziuni
+            self.lungime_maxima_lant = lungime_maxima_lant
+            self._verifica_redimensionare()
+            inceput = sfarsit
+
+        if self.index_prefix is not None:
+            self.index_prefix.adauga(cnp_uri)
+
+    def _verifica_redimensionare(self):
+        """Pornește un rehash incremental când factorul de încărcare depășește pragul"""
+        if (self.factor_incarcare_maxim is None or self.table_noua is not None
+                or self.numar_elemente <= self.factor_incarcare_maxim * self.size):
+            return
+        start = time.perf_counter()
+        self.size_nou = self.size * 2
+        self.table_noua = [None] * self.size_nou
+        self.index_rehash = 0
+        self.resize_uri += 1
+        self.timp_migrare += time.perf_counter() - start
+
+    def _pas_rehash(self, numar_bucket_uri):
+        """Mută cel mult numar_bucket_uri lanțuri din tabela veche în cea nouă"""
+        start = time.perf_counter()
+        # Ca în Redis, limităm și numărul de bucket-uri goale vizitate într-un pas
+        vizite_goale = numar_bucket_uri * 10
+        table, table_noua, size_nou = self.table, self.table_noua, self.size_nou
+
+        while numar_bucket_uri > 0 and vizite_goale > 0 and self.index_rehash < self.size:
+            lant = table[self.index_rehash]
+            if lant is None:
+                vizite_goale -= 1
+            else:
+                for cnp, nume in lant:
+                    index = self.functie_hash(cnp, size_nou)
+                    if table_noua[index] is None:
+                        table_noua[index] = [(cnp, nume)]
+                    else:
+                        table_noua[index].append((cnp, nume))
+                table[self.index_rehash] = None
+                numar_bucket_uri -= 1
+            self.index_rehash += 1
+
+        if self.index_rehash == self.size:
+            self.table, self.size = table_noua, size_nou
+            self.table_noua, self.size_nou, self.index_rehash = None, 0, 0
+        self.timp_migrare += time.perf_counter() - start
+
+    @staticmethod
+    def _cauta_in_lant(lant, cnp):
+        """Returnează numele găsit (sau None) și numărul de elemente comparate"""
+        for i, (cnp_stocat, nume) in enumerate(lant or ()):
+            if cnp_stocat == cnp:
+                return nume, i + 1
+        return None, len(lant or ())
 
     def cautare(self, cnp):
         """Caută un CNP în tabela hash și returnează iterațiile necesare"""
+        # Bucket-urile deja mutate sunt None în tabela veche, deci o putem consulta mereu
+        nume, iteratii = self._cauta_in_lant(self.table[self.functie_hash(cnp)], cnp)
+        if nume is None and self.table_noua is not None:
+            nume, iteratii_noi = self._cauta_in_lant(
+                self.table_noua[self.functie_hash(cnp, self.size_nou)], cnp)
+            iteratii += iteratii_noi
+
+        # Căutarea inițială se numără ca 1, chiar și într-un bucket gol
+        return nume, max(iteratii, 1)
+
+    def cautare_lot(self, cnp_uri):
+        """Caută mai multe CNP-uri deodată.
+
+        Hash-urile se calculează vectorizat, cheile se grupează pe bucket și fiecare
+        lanț este parcurs o singură dată pentru toate cheile care cad în el.
+        Returnează lista numelor (None pentru cele negăsite) și lista iterațiilor,
+        în ordinea cheilor primite, cu aceleași valori ca la apeluri repetate cautare.
+        """
+        nume_gasite = [None] * len(cnp_uri)
+        iteratii = [0] * len(cnp_uri)
+        self._cautare_lot_in_tabela(self.table, self.functie_hash_lot(cnp_uri), range(len(cnp_uri)),
+                                    cnp_uri, nume_gasite, iteratii)
+
+        if self.table_noua is not None:
+            ramase = [pozitie for pozitie, nume in enumerate(nume_gasite) if nume is None]
+            indici = self.functie_hash_lot([cnp_uri[pozitie] for pozitie in ramase], self.size_nou)
+            self._cautare_lot_in_tabela(self.table_noua, indici, ramase, cnp_uri, nume_gasite, iteratii)
+
+        return nume_gasite, [max(i, 1) for i in iteratii]
+
+    @staticmethod
+    def _cautare_lot_in_tabela(tabela, indici, pozitii, cnp_uri, nume_gasite, iteratii):
+        """Caută cheile de pe pozițiile date, parcurgând o singură dată fiecare lanț atins"""
+        pe_bucket = {}
+        for pozitie, index in zip(pozitii, indici):
+            pe_bucket.setdefault(index, []).append(pozitie)
+
+        for index, pozitii_bucket in pe_bucket.items():
+            lant = tabela[index]
+            if not lant:
+                continue
+            pozitii_in_lant = {}
+            for i, (cnp_stocat, nume) in enumerate(lant):
+                pozitii_in_lant.setdefault(cnp_stocat, (i + 1, nume))
+            for pozitie in pozitii_bucket:
+                gasit = pozitii_in_lant.get(cnp_uri[pozitie])
+                if gasit is None:
+                    iteratii[pozitie] += len(lant)
+                else:
+                    iteratii[pozitie] += gasit[0]
+                    nume_gasite[pozitie] = gasit[1]
+
+    def _tabele(self):
+        """Tabela veche și, în timpul unui rehash, tabela nouă"""
+        return [self.table] if self.table_noua is None else [self.table, self.table_noua]
+
+    def elemente(self):
+        """Parcurge toate perechile (CNP, nume) din tabelă"""
+        for tabela in self._tabele():
+            for lant in tabela:
+                if lant:
+                    yield from lant
+
+    def histograma_lanturi(self):
+        """Returnează {lungime lanț: număr de bucket-uri}, inclusiv bucket-urile goale"""
+        return dict(sorted(Counter(len(lant) if lant else 0
+                                   for tabela in self._tabele() for lant in tabela).items()))
+
+    def salveaza_index(self, cale, dimensiune=None):
+        """Scrie conținutul tabelei într-un fișier index binar, deschis apoi cu IndexCNPMmap.
+
+        Fișierul are un antet fix (FORMAT_ANTET_INDEX, completat la 64 de octeți),
+        directorul de bucket-uri (dimensiune + 1 poziții uint64, în stilul CSR), cheile
+        CNP ca int64 grupate pe bucket, offset-urile numelor (uint64) și blob-ul UTF-8
+        al numelor. Valorile sunt scrise în ordinea nativă little-endian. Fișierul se
+        scrie alături și apoi se redenumește, deci cititorii existenți nu sunt afectați.
+
+        Cu NumPy, sortarea pe bucket-uri se face pe array-uri de întregi (cheia,
+        indicele înregistrării, bucket-ul și permutarea: circa 28 de octeți per
+        înregistrare), iar cheile, offset-urile și numele se scriu pe bucăți, direct
+        din blob-ul de nume, fără obiecte Python per înregistrare.
+        """
+        if dimensiune is None:
+            dimensiune = max(self.numar_elemente, 1)
+        if np is None:
+            return self._salveaza_index_scalar(cale, dimensiune)
+
+        chei, inregistrari, offseturi_nume, nume_blob = self._coloane_index()
+        bucket_uri = self._hash_chei_intregi(chei, dimensiune)
+        director = np.zeros(dimensiune + 1, dtype=np.uint64)
+        np.cumsum(np.bincount(bucket_uri, minlength=dimensiune), out=director[1:])
+        # Sortare stabilă după bucket, ca în varianta scalară (sortare prin numărare)
+        ordine = np.argsort(bucket_uri, kind='stable')
+        del bucket_uri
+
+        pas = 1 << 16
+        cale_temporara = f"{cale}.tmp"
+        with open(cale_temporara, 'wb') as fisier:
+            # Antetul se rescrie la final, când lungimea blob-ului este cunoscută
+            fisier.write(bytes(DIMENSIUNE_ANTET_INDEX))
+            director.tofile(fisier)
+            del director
+            for inceput in range(0, len(ordine), pas):
+                chei[ordine[inceput:inceput + pas]].tofile(fisier)
+
+            lungime_blob = 0
+            np.zeros(1, dtype=np.uint64).tofile(fisier)
+            for inceput in range(0, len(ordine), pas):
+                bucata = inregistrari[ordine[inceput:inceput + pas]]
+                lungimi = (offseturi_nume[bucata + 1] - offseturi_nume[bucata]).astype(np.int64)
+                (np.cumsum(lungimi) + lungime_blob).astype(np.uint64).tofile(fisier)
+                lungime_blob += int(lungimi.sum())
+
+            for inceput in range(0, len(ordine), pas):
+                bucata = inregistrari[ordine[inceput:inceput + pas]]
+                inceputuri = offseturi_nume[bucata].astype(np.int64)
+                lungimi = offseturi_nume[bucata + 1].astype(np.int64) - inceputuri
+                # Pozițiile tuturor octeților din numele bucății, în ordinea din fișier
+                pozitii = np.repeat(inceputuri - (np.cumsum(lungimi) - lungimi), lungimi) + np.arange(lungimi.sum())
+                nume_blob[pozitii].tofile(fisier)
+
+            fisier.seek(0)
+            fisier.write(struct.pack(FORMAT_ANTET_INDEX, MAGIC_INDEX, dimensiune, len(chei), lungime_blob))
+        # Eliberăm vederile NumPy, ca blob-ul și offset-urile tabelei să poată crește din nou
+        del offseturi_nume, nume_blob
+        os.replace(cale_temporara, cale)
+        return cale
+
+    def _coloane_index(self):
+        """Cheile, indicii înregistrărilor, offset-urile numelor și blob-ul, ca array-uri NumPy"""
+        chei = array('q')
+        offseturi_nume = array('Q', [0])
+        nume_blob = bytearray()
+        for cnp, nume in self.elemente():
+            chei.append(int(cnp))
+            nume_blob += nume.encode('utf-8')
+            offseturi_nume.append(len(nume_blob))
+        return (np.frombuffer(chei, dtype=np.int64), np.arange(len(chei)),
+                np.frombuffer(offseturi_nume, dtype=np.uint64), np.frombuffer(nume_blob, dtype=np.uint8))
+
+    def _chei_intregi(self):
+        """CNP-urile stocate, ca array NumPy int64"""
+        return np.fromiter((int(cnp) for cnp, _ in self.elemente()), dtype=np.int64)
+
+    @staticmethod
+    def _hash_chei_intregi(chei, dimensiune):
+        """functie_hash (polinomial-31) pentru CNP-uri date ca int64, pe bucăți, fără șiruri.
+
+        Toate CNP-urile au 13 cifre, deci caracterele sunt cifrele cheii, de la stânga.
+        """
+        bucket_uri = np.empty(len(chei), dtype=np.int64)
+        pas = 1 << 20
+        for inceput in range(0, len(chei), pas):
+            bucata = chei[inceput:inceput + pas]
+            valori_hash = np.zeros(len(bucata), dtype=np.int64)
+            for putere in range(12, -1, -1):
+                cifra = bucata // 10 ** putere % 10
+                valori_hash = (valori_hash * 31 + cifra + ord('0')) % dimensiune
+            bucket_uri[inceput:inceput + pas] = valori_hash
+        return bucket_uri
+
+    def _salveaza_index_scalar(self, cale, dimensiune):
+        """Varianta fără NumPy a salveaza_index, cu sortare prin numărare în Python"""
+        chei = array('q')
+        bucket_uri = array('q')
+        nume_uri = []
+        lot_cnp = []
+        for cnp, nume in self.elemente():
+            lot_cnp.append(cnp)
+            nume_uri.append(nume)
+            if len(lot_cnp) == 1 << 16:
+                bucket_uri.extend(self.functie_hash_lot(lot_cnp, dimensiune))
+                chei.extend(int(cnp) for cnp in lot_cnp)
+                lot_cnp = []
+        bucket_uri.extend(self.functie_hash_lot(lot_cnp, dimensiune))
+        chei.extend(int(cnp) for cnp in lot_cnp)
+
+        # Sortare prin numărare după bucket; directorul devine vectorul de început
+        director = array('Q', bytes(8 * (dimensiune + 1)))
+        for bucket in bucket_uri:
+            director[bucket + 1] += 1
+        for bucket in range(dimensiune):
+            director[bucket + 1] += director[bucket]
+        urmatoarea_pozitie = array('Q', director)
+        ordine = array('q', bytes(8 * len(chei)))
+        for i, bucket in enumerate(bucket_uri):
+            ordine[urmatoarea_pozitie[bucket]] = i
+            urmatoarea_pozitie[bucket] += 1
+        del urmatoarea_pozitie, bucket_uri
+
+        chei_sortate = array('q', (chei[i] for i in ordine))
+        offseturi_nume = array('Q', [0])
+        nume_blob = bytearray()
+        for i in ordine:
+            nume_blob += nume_uri[i].encode('utf-8')
+            offseturi_nume.append(len(nume_blob))
+
+        cale_temporara = f"{cale}.tmp"
+        with open(cale_temporara, 'wb') as fisier:
+            antet = struct.pack(FORMAT_ANTET_INDEX, MAGIC_INDEX, dimensiune, len(chei), len(nume_blob))
+            fisier.write(antet.ljust(DIMENSIUNE_ANTET_INDEX, b'\0'))
+            director.tofile(fisier)
+            chei_sortate.tofile(fisier)
+            offseturi_nume.tofile(fisier)
+            fisier.write(nume_blob)
+        os.replace(cale_temporara, cale)
+        return cale
+
+    def construieste_index_prefix(self):
+        """Construiește indexul secundar pe câmpurile CNP-ului (vezi IndexPrefixCNP).
+
+        După construire, inserările ulterioare îl actualizează automat.
+        """
+        start_timp = time.time()
+        if np is None:
+            self.index_prefix = IndexPrefixCNP(cnp for cnp, _ in self.elemente())
+        else:
+            self.index_prefix = IndexPrefixCNP(self._chei_intregi())
+        self.timp_index_prefix = time.time() - start_timp
+        return self.index_prefix
+
+    def _statistici_index_prefix(self):
+        if self.index_prefix is None:
+            return {}
+        return {
+            'inregistrari_index_prefix': len(self.index_prefix),
+            'timp_index_prefix': self.timp_index_prefix
+        }
+
+    def statistici(self):
+        """Returnează statistici despre tabela hash"""
+        lungimi_lanturi = [len(slot) for tabela in self._tabele() for slot in tabela if slot]
+        slot_uri_ocupate = len(lungimi_lanturi)
+        capacitate = self.size + self.size_nou
+        factor_incarcare = slot_uri_ocupate / capacitate
+        return {
+            'dimensiune': self._tabela_activa()[1],
+            'slot_uri_ocupate': slot_uri_ocupate,
+            'factor_incarcare': factor_incarcare,
+            'coliziuni': self.coliziuni,
+            'lungime_maxima_lant': max(lungimi_lanturi, default=0),
+            'octeti_per_inregistrare': self.memorie_ocupata() / max(self.numar_elemente, 1),
+            'capacitate': capacitate,
+            'resize_uri': self.resize_uri,
+            'timp_migrare': self.timp_migrare,
+            'rehash_in_curs': self.table_noua is not None,
+            **self._statistici_index_prefix()
+        }
+
+    def memorie_ocupata(self):
+        """Estimează memoria (în octeți) ocupată de lanțuri, tupluri și șiruri"""
+        total = 0
+        for tabela in self._tabele():
+            total += sys.getsizeof(tabela)
+            for lant in tabela:
+                if lant is None:
+                    continue
+                total += sys.getsizeof(lant)
+                for cnp, nume in lant:
+                    total += sys.getsizeof((cnp, nume)) + sys.getsizeof(cnp) + sys.getsizeof(nume)
+        return total
+
+
+class HashTableAdresareDeschisa(HashTable):
+    """Tabelă hash cu adresare deschisă (sondare liniară) pentru CNP-uri.
+
+    În locul listelor de lanțuri, CNP-urile sunt păstrate ca întregi pe 64 de biți
+    într-un array plat, iar numele într-un singur blob de octeți, accesat prin
+    offset-uri. Un slot liber are cheia 0 (niciun CNP valid nu începe cu 0).
+    Funcția de hash este aceeași cu cea din HashTable, deci statisticile pot fi
+    comparate direct.
+
+    Peste factor_incarcare_maxim tabela se dublează, tot incremental: array-urile
+    vechi rămân neatinse (golirea unui slot ar rupe secvențele de sondare) și
+    fiecare inserare mută încă sloturi_per_pas sloturi din ele în tabela nouă.
+    Căutările consultă tabela nouă și apoi pe cea veche; o cheie încă nemutată
+    își primește numele nou direct în tabela veche, ca mutarea ei ulterioară să
+    nu aducă un nume vechi. inserare_lot termină migrarea înainte de lot, deci
+    costul ei se împarte la înregistrările lotului.
+    """
+
+    def __init__(self, size=DIMENSIUNE_INITIALA, factor_incarcare_maxim=0.7, sloturi_per_pas=16):
+        self.size = size
+        self.chei = array('q', bytes(8 * size))
+        # Pentru fiecare slot: indicele înregistrării în offseturi_nume
+        self.inregistrari = array('i', bytes(4 * size))
+        self.offseturi_nume = array('Q', [0])
+        self.nume_blob = bytearray()
+        self.factor_incarcare_maxim = factor_incarcare_maxim
+        self.sloturi_per_pas = sloturi_per_pas
+        # Starea migrării incrementale; chei_vechi este None în afara unei redimensionări
+        self.chei_vechi = None
+        self.inregistrari_vechi = None
+        self.size_vechi = 0
+        self.index_migrare = 0
+        self.resize_uri = 0
+        self.timp_migrare = 0.0
+        self.numar_elemente = 0
+        self.coliziuni = 0
+        self.lungime_maxima_lant = 0
+        self.index_prefix = None
+        self.timp_index_prefix = 0.0
+
+    def _adauga_nume(self, nume):
+        """Adaugă numele în blob și returnează indicele înregistrării"""
+        self.nume_blob += nume.encode('utf-8')
+        self.offseturi_nume.append(len(self.nume_blob))
+        return len(self.offseturi_nume) - 2
+
+    def _citeste_nume(self, inregistrare):
+        start = self.offseturi_nume[inregistrare]
+        sfarsit = self.offseturi_nume[inregistrare + 1]
+        return self.nume_blob[start:sfarsit].decode('utf-8')
+
+    def inserare(self, cnp, nume):
+        """Inserează o pereche CNP-nume; un CNP existent primește numele nou"""
+        inregistrare = self._adauga_nume(nume)
+        if self.chei_vechi is not None:
+            self._pas_migrare(self.sloturi_per_pas)
+        # Pasul de mai sus poate termina migrarea
+        if self.chei_vechi is None:
+            self._inserare_la_index(int(cnp), self.functie_hash(cnp), inregistrare)
+        else:
+            self._inserare_in_migrare(cnp, inregistrare)
+        self._verifica_redimensionare()
+        if self.index_prefix is not None:
+            self.index_prefix.adauga([cnp])
+
+    def inserare_lot(self, cnp_uri, nume_uri):
+        """Inserează în bloc perechile CNP-nume, cu hash-urile calculate vectorizat.
+
+        O migrare în curs este terminată, iar tabela este redimensionată o singură
+        dată, înainte de lot, la capacitatea necesară tuturor înregistrărilor din lot.
+        """
+        self._termina_migrarea()
+        if self.factor_incarcare_maxim is not None:
+            size_nou = self.size
+            while self.numar_elemente + len(cnp_uri) > self.factor_incarcare_maxim * size_nou:
+                size_nou *= 2
+            if size_nou != self.size:
+                self._porneste_migrarea(size_nou)
+                self._termina_migrarea()
+
+        indici = self.functie_hash_lot(cnp_uri)
+        for index, cnp, nume in zip(indici, cnp_uri, nume_uri):
+            self._inserare_la_index(int(cnp), index, self._adauga_nume(nume))
+        if self.index_prefix is not None:
+            self.index_prefix.adauga(cnp_uri)
+
+    def _inserare_in_migrare(self, cnp, inregistrare):
+        """Inserează în timpul migrării; o cheie încă nemutată este actualizată în tabela veche"""
+        cheie = int(cnp)
         index = self.functie_hash(cnp)
-        iteratii = 1  # Căutarea inițială se numără ca 1
+        if self._sondeaza(self.chei, self.size, cheie, index)[0] < 0:
+            slot_vechi, _ = self._sondeaza(self.chei_vechi, self.size_vechi, cheie,
+                                           self.functie_hash(cnp, self.size_vechi))
+            if slot_vechi >= 0:
+                self.inregistrari_vechi[slot_vechi] = inregistrare
+                return
+        self._inserare_la_index(cheie, index, inregistrare)
+
+    def _verifica_redimensionare(self):
+        """Pornește o migrare incrementală când factorul de încărcare depășește pragul"""
+        if (self.factor_incarcare_maxim is not None and self.chei_vechi is None
+                and self.numar_elemente > self.factor_incarcare_maxim * self.size):
+            self._porneste_migrarea(self.size * 2)
+
+    def _porneste_migrarea(self, size_nou):
+        """Alocă tabela nouă cu size_nou sloturi; cea curentă devine tabela veche"""
+        start = time.perf_counter()
+        self.chei_vechi, self.inregistrari_vechi, self.size_vechi = self.chei, self.inregistrari, self.size
+        self.size = size_nou
+        self.chei = array('q', bytes(8 * size_nou))
+        self.inregistrari = array('i', bytes(4 * size_nou))
+        self.index_migrare = 0
+        self.lungime_maxima_lant = 0
+        self.resize_uri += 1
+        self.timp_migrare += time.perf_counter() - start
+
+    def _pas_migrare(self, numar_sloturi):
+        """Mută cel mult numar_sloturi sloturi din tabela veche în cea nouă"""
+        start = time.perf_counter()
+        inceput = self.index_migrare
+        sfarsit = min(inceput + numar_sloturi, self.size_vechi)
+        ocupate = [(cheie, inregistrare) for cheie, inregistrare in
+                   zip(self.chei_vechi[inceput:sfarsit], self.inregistrari_vechi[inceput:sfarsit]) if cheie]
+        if ocupate:
+            # Cheile sunt CNP-uri fără zerouri la început, deci str() reface exact șirul hash-uit
+            cnp_uri = [str(cheie) for cheie, _ in ocupate]
+            if len(cnp_uri) > 64:
+                indici = self.functie_hash_lot(cnp_uri)
+            else:
+                indici = [self.functie_hash(cnp) for cnp in cnp_uri]
+            # Cheile mutate sunt deja numărate, iar mutarea nu este o coliziune a utilizatorului
+            numar_elemente, coliziuni = self.numar_elemente, self.coliziuni
+            for index, (cheie, inregistrare) in zip(indici, ocupate):
+                self._inserare_la_index(cheie, index, inregistrare)
+            self.numar_elemente, self.coliziuni = numar_elemente, coliziuni
+
+        self.index_migrare = sfarsit
+        if sfarsit == self.size_vechi:
+            self.chei_vechi = self.inregistrari_vechi = None
+            self.size_vechi = self.index_migrare = 0
+        self.timp_migrare += time.perf_counter() - start
+
+    def _termina_migrarea(self):
+        """Mută tot ce a rămas din tabela veche, pe bucăți, ca memoria temporară să rămână mică"""
+        while self.chei_vechi is not None:
+            self._pas_migrare(1 << 20)
+
+    @staticmethod
+    def _sondeaza(chei, size, cheie, index):
+        """Sondează liniar de la index; returnează slotul cheii (-1 dacă lipsește) și sondările"""
+        iteratii = 1
+        while chei[index] != 0:
+            if chei[index] == cheie:
+                return index, iteratii
+            if iteratii == size:
+                break
+            index += 1
+            if index == size:
+                index = 0
+            iteratii += 1
+        return -1, iteratii
+
+    def _inserare_la_index(self, cheie, index, inregistrare):
+        """Sondează liniar începând de la index și plasează cheia în primul slot liber"""
+        chei = self.chei
+
+        if chei[index] != 0:
+            self.coliziuni += 1
 
-        # Căutăm în lanțul de la acest index
-        for i, (cnp_stocat, nume) in enumerate(self.table[index]):
-            if i > 0:  # După primul element, iterăm în lanț
-                iteratii += 1
-            if cnp_stocat == cnp:
-                return nume, iteratii
+        lungime_sondare = 1
+        while chei[index] != 0:
+            if chei[index] == cheie:
+                self.inregistrari[index] = inregistrare
+                return
+            index += 1
+            if index == self.size:
+                index = 0
+            lungime_sondare += 1
+            if lungime_sondare > self.size:
+                raise ValueError("Tabela hash este plină")
+
+        chei[index] = cheie
+        self.inregistrari[index] = inregistrare
+        self.numar_elemente += 1
+
+        if lungime_sondare > self.lungime_maxima_lant:
+            self.lungime_maxima_lant = lungime_sondare
 
+    def cautare(self, cnp):
+        """Caută un CNP și returnează numele și numărul de sondări efectuate"""
+        cheie = int(cnp)
+        slot, iteratii = self._sondeaza(self.chei, self.size, cheie, self.functie_hash(cnp))
+        if slot >= 0:
+            return self._citeste_nume(self.inregistrari[slot]), iteratii
+        if self.chei_vechi is not None:
+            slot, iteratii_vechi = self._sondeaza(self.chei_vechi, self.size_vechi, cheie,
+                                                  self.functie_hash(cnp, self.size_vechi))
+            iteratii += iteratii_vechi
+            if slot >= 0:
+                return self._citeste_nume(self.inregistrari_vechi[slot]), iteratii
         return None, iteratii
 
+    def cautare_lot(self, cnp_uri):
+        """Caută mai multe CNP-uri deodată, cu sondare vectorizată.
+
+        La fiecare pas se compară simultan slotul curent al tuturor cheilor încă
+        active; cheile găsite sau ajunse într-un slot liber ies din set, restul
+        avansează cu o poziție. În timpul unei migrări, cheile negăsite sunt căutate
+        la fel și în tabela veche. Returnează lista numelor și lista sondărilor.
+        """
+        if np is None:
+            rezultate = [self.cautare(cnp) for cnp in cnp_uri]
+            return [nume for nume, _ in rezultate], [iteratii for _, iteratii in rezultate]
+
+        inregistrari, iteratii = self._sondare_lot(self.chei, self.inregistrari, self.size, cnp_uri)
+        nume_gasite = [None if inregistrare < 0 else self._citeste_nume(inregistrare)
+                       for inregistrare in inregistrari]
+        if self.chei_vechi is not None:
+            ramase = [pozitie for pozitie, inregistrare in enumerate(inregistrari) if inregistrare < 0]
+            inregistrari_vechi, iteratii_vechi = self._sondare_lot(
+                self.chei_vechi, self.inregistrari_vechi, self.size_vechi, [cnp_uri[pozitie] for pozitie in ramase])
+            for pozitie, inregistrare, iteratii_in_veche in zip(ramase, inregistrari_vechi, iteratii_vechi):
+                iteratii[pozitie] += iteratii_in_veche
+                if inregistrare >= 0:
+                    nume_gasite[pozitie] = self._citeste_nume(inregistrare)
+        return nume_gasite, iteratii
+
+    def _sondare_lot(self, chei_tabela, inregistrari_tabela, size, cnp_uri):
+        """Sondarea vectorizată a unei tabele; returnează înregistrările (-1 = negăsit) și sondările"""
+        chei_tabela = np.frombuffer(chei_tabela, dtype=np.int64)
+        inregistrari_tabela = np.frombuffer(inregistrari_tabela, dtype=np.int32)
+        chei = np.asarray(cnp_uri, dtype=bytes).astype(np.int64)
+        index = np.asarray(self.functie_hash_lot(cnp_uri, size), dtype=np.int64)
+        inregistrari = np.full(len(chei), -1, dtype=np.int64)
+        iteratii = np.ones(len(chei), dtype=np.int64)
+
+        active = np.arange(len(chei))
+        while len(active) and iteratii[active[0]] <= size:
+            sloturi = chei_tabela[index[active]]
+            gasite = sloturi == chei[active]
+            inregistrari[active[gasite]] = inregistrari_tabela[index[active[gasite]]]
+            active = active[~gasite & (sloturi != 0)]
+            index[active] = (index[active] + 1) % size
+            iteratii[active] += 1
+        # Eliberăm vederile NumPy, ca array-urile tabelei să poată fi redimensionate
+        del chei_tabela, inregistrari_tabela
+
+        iteratii[active] = size
+        return inregistrari.tolist(), iteratii.tolist()
+
+    def _tabele_sloturi(self):
+        """(chei, înregistrări, dimensiune, primul slot nemutat) pentru tabela nouă și, în migrare, cea veche"""
+        tabele = [(self.chei, self.inregistrari, self.size, 0)]
+        if self.chei_vechi is not None:
+            tabele.append((self.chei_vechi, self.inregistrari_vechi, self.size_vechi, self.index_migrare))
+        return tabele
+
+    def _coloane_index(self):
+        """Coloanele pentru salveaza_index, luate direct din array-uri și din blob-ul de nume.
+
+        Numele înlocuite rămân în blob, dar nu sunt referite de nicio înregistrare,
+        deci nu ajung în index.
+        """
+        chei, inregistrari = [], []
+        for chei_tabela, inregistrari_tabela, _, inceput in self._tabele_sloturi():
+            chei_tabela = np.frombuffer(chei_tabela, dtype=np.int64)[inceput:]
+            ocupate = chei_tabela != 0
+            chei.append(chei_tabela[ocupate])
+            inregistrari.append(np.frombuffer(inregistrari_tabela, dtype=np.int32)[inceput:][ocupate])
+        # Offset-urile și blob-ul sunt vederi fără copiere; salveaza_index le eliberează la ieșire
+        return (np.concatenate(chei), np.concatenate(inregistrari),
+                np.frombuffer(self.offseturi_nume, dtype=np.uint64), np.frombuffer(self.nume_blob, dtype=np.uint8))
+
+    def _chei_intregi(self):
+        """CNP-urile stocate, luate direct din sloturile ocupate"""
+        chei = []
+        for chei_tabela, _, _, inceput in self._tabele_sloturi():
+            chei_tabela = np.frombuffer(chei_tabela, dtype=np.int64)[inceput:]
+            chei.append(chei_tabela[chei_tabela != 0])
+        return np.concatenate(chei)
+
+    def elemente(self):
+        """Parcurge toate perechile (CNP, nume) din tabelă"""
+        for chei, inregistrari, _, inceput in self._tabele_sloturi():
+            for cheie, inregistrare in zip(chei[inceput:], inregistrari[inceput:]):
+                if cheie:
+                    yield str(cheie), self._citeste_nume(inregistrare)
+
+    def histograma_lanturi(self):
+        """Returnează {lungime secvență de sondare: număr de chei} pentru cheile stocate"""
+        histograma = Counter()
+        for chei, _, size, inceput in self._tabele_sloturi():
+            sloturi = [slot for slot in range(inceput, size) if chei[slot]]
+            acasa = self.functie_hash_lot([str(chei[slot]) for slot in sloturi], size)
+            histograma.update((slot - index) % size + 1 for slot, index in zip(sloturi, acasa))
+        return dict(sorted(histograma.items()))
+
     def statistici(self):
-        """Returnează statistici despre tabela hash"""
-        slot_uri_ocupate = sum(1 for slot in self.table if slot)
-        factor_incarcare = slot_uri_ocupate / self.size
+        """Returnează statistici în același format ca HashTable"""
         return {
             'dimensiune': self.size,
-            'slot_uri_ocupate': slot_uri_ocupate,
-            'factor_incarcare': factor_incarcare,
+            'slot_uri_ocupate': self.numar_elemente,
+            'factor_incarcare': self.numar_elemente / self.size,
             'coliziuni': self.coliziuni,
-            'lungime_maxima_lant': self.lungime_maxima_lant
+            # La adresarea deschisă, „lanțul” este secvența de sondare
+            'lungime_maxima_lant': self.lungime_maxima_lant,
+            'octeti_per_inregistrare': self.memorie_ocupata() / max(self.numar_elemente, 1),
+            'capacitate': self.size + self.size_vechi,
+            'resize_uri': self.resize_uri,
+            'timp_migrare': self.timp_migrare,
+            'rehash_in_curs': self.chei_vechi is not None,
+            **self._statistici_index_prefix()
+        }
+
+    def memorie_ocupata(self):
+        """Memoria (în octeți) ocupată de array-uri și de blob-ul de nume"""
+        return (sum(chei.itemsize * len(chei) + inregistrari.itemsize * len(inregistrari)
+                    for chei, inregistrari, _, _ in self._tabele_sloturi())
+                + self.offseturi_nume.itemsize * len(self.offseturi_nume)
+                + len(self.nume_blob))
+
+
+class IndexCNPMmap:
+    """Index CNP doar pentru citire, deschis prin mmap dintr-un fișier scris de salveaza_index.
+
+    Deschiderea citește doar antetul; directorul, cheile și numele sunt vederi
+    memoryview peste fișierul mapat, deci nu se creează obiecte Python per
+    înregistrare, iar paginile sunt aduse de sistemul de operare la cerere.
+    Mai multe procese care deschid același fișier partajează aceleași pagini din
+    cache-ul sistemului. Căutările întorc aceleași iterații ca HashTable.
+    """
+
+    # Aceeași funcție de hash ca tabelele din care se scrie indexul
+    functie_hash = HashTable.functie_hash
+    functie_hash_lot = HashTable.functie_hash_lot
+
+    def __init__(self, cale):
+        if sys.byteorder != 'little':
+            raise ValueError("Indexul CNP poate fi citit doar pe sisteme little-endian")
+        self.cale = cale
+        self.fisier = open(cale, 'rb')
+        self.harta = mmap.mmap(self.fisier.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, self.size, self.numar_elemente, lungime_blob = struct.unpack_from(FORMAT_ANTET_INDEX, self.harta)
+        if magic != MAGIC_INDEX:
+            self.inchide()
+            raise ValueError(f"{cale} nu este un index CNP valid")
+
+        vedere = memoryview(self.harta)
+        inceput = DIMENSIUNE_ANTET_INDEX
+        sfarsit = inceput + 8 * (self.size + 1)
+        self.director = vedere[inceput:sfarsit].cast('Q')
+        inceput, sfarsit = sfarsit, sfarsit + 8 * self.numar_elemente
+        self.chei = vedere[inceput:sfarsit].cast('q')
+        inceput, sfarsit = sfarsit, sfarsit + 8 * (self.numar_elemente + 1)
+        self.offseturi_nume = vedere[inceput:sfarsit].cast('Q')
+        self.nume_blob = vedere[sfarsit:sfarsit + lungime_blob]
+
+    def cautare(self, cnp):
+        """Caută un CNP în index și returnează numele și iterațiile necesare"""
+        cheie = int(cnp)
+        index = self.functie_hash(cnp)
+        inceput, sfarsit = self.director[index], self.director[index + 1]
+        chei = self.chei
+        for pozitie in range(inceput, sfarsit):
+            if chei[pozitie] == cheie:
+                nume = self.nume_blob[self.offseturi_nume[pozitie]:self.offseturi_nume[pozitie + 1]]
+                return bytes(nume).decode('utf-8'), pozitie - inceput + 1
+        return None, max(sfarsit - inceput, 1)
+
+    def cautare_lot(self, cnp_uri):
+        """Caută mai multe CNP-uri; returnează lista numelor și lista iterațiilor"""
+        rezultate = [self.cautare(cnp) for cnp in cnp_uri]
+        return [nume for nume, _ in rezultate], [iteratii for _, iteratii in rezultate]
+
+    def statistici(self):
+        """Returnează statistici despre index, în formatul folosit de HashTable"""
+        lungimi_lanturi = [self.director[i + 1] - self.director[i] for i in range(self.size)]
+        slot_uri_ocupate = sum(1 for lungime in lungimi_lanturi if lungime)
+        return {
+            'dimensiune': self.size,
+            'slot_uri_ocupate': slot_uri_ocupate,
+            'factor_incarcare': slot_uri_ocupate / self.size,
+            'lungime_maxima_lant': max(lungimi_lanturi, default=0),
+            'numar_inregistrari': self.numar_elemente,
+            'dimensiune_fisier': len(self.harta)
         }
 
+    def inchide(self):
+        """Eliberează vederile și închide maparea și fișierul"""
+        for vedere in ('director', 'chei', 'offseturi_nume', 'nume_blob'):
+            if hasattr(self, vedere):
+                getattr(self, vedere).release()
+        self.harta.close()
+        self.fisier.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.inchide()
+
+
+def decodifica_cnp(cnp):
+    """Descompune un CNP în (sex/secol, an complet, lună, zi, județ, număr de ordine)"""
+    sex_secol = int(cnp[0])
+    if sex_secol in (3, 4):
+        secol = 1800
+    elif sex_secol in (5, 6):
+        secol = 2000
+    else:  # 1, 2 și, prin convenție, rezidenții/străinii (7, 8, 9)
+        secol = 1900
+    return (sex_secol, secol + int(cnp[1:3]), int(cnp[3:5]), int(cnp[5:7]),
+            int(cnp[7:9]), int(cnp[9:12]))
+
+
+def cheie_prefix(judet, an=0, luna=0, zi=0, sex_secol=0, nr_ordine=0):
+    """Împachetează câmpurile într-un întreg ordonat după județ, dată, sex și număr de ordine"""
+    return ((((judet * 10000 + an) * 100 + luna) * 100 + zi) * 10 + sex_secol) * 1000 + nr_ordine
+
+
+class IndexPrefixCNP:
+    """Index secundar sortat pentru interogări după județ și data nașterii.
+
+    Fiecare CNP este decodificat într-o cheie compactă (cheie_prefix) ordonată după
+    județ, apoi data completă a nașterii, sex și număr de ordine; cheile stau
+    sortate într-un array, alături de CNP-urile corespunzătoare. O interogare pe un
+    prefix (județ, an, lună, zi) sau pe un interval de date devine un interval
+    contiguu, găsit prin căutare binară: O(log n) plus dimensiunea rezultatului.
+    Cifra de control nu intră în cheie, fiind determinată de celelalte cifre, așa
+    că o cheie apare o singură dată: la duplicate se păstrează prima apariție.
+    """
+
+    # Adăugările mai mici de atât (sau de 1/256 din index) așteaptă în tampon
+    PRAG_INTERCLASARE = 4096
+
+    def __init__(self, cnp_uri=()):
+        """cnp_uri: CNP-uri ca șiruri sau, cu NumPy, direct un array int64"""
+        self.in_asteptare = {}
+        if np is None:
+            perechi = {}
+            for cnp in cnp_uri:
+                sex_secol, an, luna, zi, judet, nr_ordine = decodifica_cnp(cnp)
+                perechi.setdefault(cheie_prefix(judet, an, luna, zi, sex_secol, nr_ordine), int(cnp))
+            self.chei = array('q', sorted(perechi))
+            self.cnp_uri = array('q', (perechi[cheie] for cheie in self.chei))
+            return
+
+        if not isinstance(cnp_uri, np.ndarray):
+            cnp_uri = np.fromiter(map(int, cnp_uri), dtype=np.int64)
+        chei = self._chei_prefix_lot(cnp_uri)
+        # Sortarea stabilă păstrează prima apariție pe primul loc între cheile egale
+        ordine = np.argsort(chei, kind='stable')
+        chei = chei[ordine]
+        cnp_uri = cnp_uri[ordine]
+        del ordine
+        if len(chei) > 1:
+            prime = np.empty(len(chei), dtype=bool)
+            prime[0] = True
+            np.not_equal(chei[1:], chei[:-1], out=prime[1:])
+            if not prime.all():
+                chei, cnp_uri = chei[prime], cnp_uri[prime]
+        self.chei, self.cnp_uri = array('q'), array('q')
+        self.chei.frombytes(chei.tobytes())
+        self.cnp_uri.frombytes(cnp_uri.tobytes())
+
+    @staticmethod
+    def _chei_prefix_lot(cnp_uri):
+        """cheie_prefix pentru CNP-uri date ca int64, calculată pe bucăți, fără șiruri"""
+        chei = np.empty(len(cnp_uri), dtype=np.int64)
+        pas = 1 << 20
+        for inceput in range(0, len(cnp_uri), pas):
+            bucata = cnp_uri[inceput:inceput + pas]
+            sex_secol = bucata // 10 ** 12
+            secol = np.where((sex_secol == 3) | (sex_secol == 4), 1800,
+                             np.where((sex_secol == 5) | (sex_secol == 6), 2000, 1900))
+            an = secol + bucata // 10 ** 10 % 100
+            luna = bucata // 10 ** 8 % 100
+            zi = bucata // 10 ** 6 % 100
+            judet = bucata // 10 ** 4 % 100
+            nr_ordine = bucata // 10 % 1000
+            chei[inceput:inceput + pas] = cheie_prefix(judet, an, luna, zi, sex_secol, nr_ordine)
+        return chei
+
+    def __len__(self):
+        self._interclaseaza()
+        return len(self.chei)
+
+    def adauga(self, cnp_uri):
+        """Adaugă CNP-uri noi, păstrând ordinea; CNP-urile deja indexate sunt ignorate.
+
+        Cheile noi se adună într-un tampon, interclasat cu array-urile abia când
+        depășește pragul sau la următoarea interogare; astfel o inserare unitară nu
+        mai copiază tot indexul.
+        """
+        for cnp in cnp_uri:
+            sex_secol, an, luna, zi, judet, nr_ordine = decodifica_cnp(cnp)
+            self.in_asteptare.setdefault(cheie_prefix(judet, an, luna, zi, sex_secol, nr_ordine), int(cnp))
+        if len(self.in_asteptare) >= max(self.PRAG_INTERCLASARE, len(self.chei) >> 8):
+            self._interclaseaza()
+
+    def _interclaseaza(self):
+        """Interclasează tamponul cu array-urile existente, într-o singură trecere.
+
+        Bucățile dintre pozițiile de inserare (găsite prin căutare binară) se copiază
+        în bloc. Cheile deja indexate sunt sărite: cheia determină CNP-ul.
+        """
+        noi = self.in_asteptare
+        if not noi:
+            return
+        self.in_asteptare = {}
+
+        chei_vechi, cnp_uri_vechi = self.chei, self.cnp_uri
+        chei, cnp_uri_interclasate = array('q'), array('q')
+        inceput = 0
+        for cheie in sorted(noi):
+            pozitie = bisect_left(chei_vechi, cheie, inceput)
+            chei.extend(chei_vechi[inceput:pozitie])
+            cnp_uri_interclasate.extend(cnp_uri_vechi[inceput:pozitie])
+            inceput = pozitie
+            if pozitie < len(chei_vechi) and chei_vechi[pozitie] == cheie:
+                continue
+            chei.append(cheie)
+            cnp_uri_interclasate.append(noi[cheie])
+        chei.extend(chei_vechi[inceput:])
+        cnp_uri_interclasate.extend(cnp_uri_vechi[inceput:])
+        self.chei, self.cnp_uri = chei, cnp_uri_interclasate
+
+    def _intre(self, cheie_minima, cheie_maxima):
+        self._interclaseaza()
+        inceput = bisect_left(self.chei, cheie_minima)
+        sfarsit = bisect_right(self.chei, cheie_maxima)
+        return [str(cnp) for cnp in self.cnp_uri[inceput:sfarsit]]
+
+    def interval(self, judet, de_la, pana_la):
+        """CNP-urile din județul dat cu data nașterii între de_la și pana_la (tupluri (an, lună, zi), inclusiv)"""
+        return self._intre(cheie_prefix(judet, *de_la), cheie_prefix(judet, *pana_la, 9, 999))
+
+    def prefix(self, judet=None, an=None, luna=None, zi=None):
+        """CNP-urile care se potrivesc cu un prefix (județ, an, lună, zi).
+
+        Câmpurile se completează de la stânga la dreapta (luna cere anul, ziua cere
+        luna). Fără județ, interogarea se repetă pentru fiecare județ.
+        """
+        if (luna is not None and an is None) or (zi is not None and luna is None):
+            raise ValueError("Prefixul trebuie completat în ordinea an, lună, zi")
+        if judet is None:
+            return [cnp for judet in range(1, len(JUDETE) + 1) for cnp in self.prefix(judet, an, luna, zi)]
+        if an is None:
+            return self._intre(cheie_prefix(judet), cheie_prefix(judet + 1) - 1)
+        de_la = (an, luna or 1, zi or 1)
+        pana_la = (an, luna or 12, zi or 31)
+        return self.interval(judet, de_la, pana_la)
+
+
+MOTOARE = {
+    'Înlănțuire': HashTable,
+    'Adresare deschisă': HashTableAdresareDeschisa,
+}
+
 
 def calculeaza_cifra_control(cnp_partial):
     """Calculează cifra de control pentru un CNP"""
@@ -73,25 +1046,96 @@ def calculeaza_cifra_control(cnp_partial):
     return str(cifra_control)
 
 
-def genereaza_cnp_valid():
+# Sex și secol: 1-9
+# 1,2: bărbat/femeie născut între 1900-1999
+# 3,4: bărbat/femeie născut între 1800-1899
+# 5,6: bărbat/femeie născut între 2000-2099
+# 7,8: bărbați/femei rezidenți
+# 9: persoane străine
+SEXE_SECOLE = [1, 2, 5, 6]
+PONDERI_SEXE_SECOLE = [40, 40, 10, 10]
+
+# Codul județului: 01-52
+JUDETE = [f"{i:02d}" for i in range(1, 53)]
+# Ponderi aproximative bazate pe distribuția populației
+PONDERI_JUDETE = [
+    4.5,  # 01-Alba
+    5.7,  # 02-Arad
+    3.8,  # 03-Argeș
+    3.1,  # 04-Bacău
+    2.9,  # 05-Bihor
+    4.3,  # 06-Bistrița-Năsăud
+    2.2,  # 07-Botoșani
+    5.9,  # 08-Brașov
+    3.2,  # 09-Brăila
+    3.1,  # 10-Buzău
+    1.9,  # 11-Caraș-Severin
+    3.0,  # 12-Cluj
+    8.4,  # 13-Constanța
+    2.3,  # 14-Covasna
+    3.9,  # 15-Dâmbovița
+    3.5,  # 16-Dolj
+    3.2,  # 17-Galați
+    3.0,  # 18-Gorj
+    2.2,  # 19-Harghita
+    2.1,  # 20-Hunedoara
+    3.3,  # 21-Ialomița
+    4.0,  # 22-Iași
+    3.1,  # 23-Ilfov
+    2.2,  # 24-Maramureș
+    2.1,  # 25-Mehedinți
+    2.8,  # 26-Mureș
+    2.4,  # 27-Neamț
+    2.3,  # 28-Olt
+    4.0,  # 29-Prahova
+    2.1,  # 30-Satu Mare
+    2.5,  # 31-Sălaj
+    2.6,  # 32-Sibiu
+    3.0,  # 33-Suceava
+    2.2,  # 34-Teleorman
+    3.5,  # 35-Timiș
+    2.0,  # 36-Tulcea
+    2.1,  # 37-Vaslui
+    2.2,  # 38-Vâlcea
+    2.0,  # 39-Vrancea
+    9.5,  # 40-București
+    0.5,  # 41-București S1
+    0.5,  # 42-București S2
+    0.5,  # 43-București S3
+    0.5,  # 44-București S4
+    0.5,  # 45-București S5
+    0.5,  # 46-București S6
+    0.4,  # 47-București S7 (nu mai există)
+    0.4,  # 48-București S8 (nu mai există)
+    0.1,  # 49-51 (rezervate)
+    0.1,
+    0.1,
+    0.1  # 52 (non-rezident)
+]
+
+
+def interval_ani(sex_secol):
+    """Intervalul anilor de naștere generați pentru o cifră de sex/secol"""
+    if sex_secol in [1, 2]:  # 1900-1999
+        return 1950, 1999
+    return 2000, 2023  # 2000-2099
+
+
+def genereaza_cnp_valid(rng=random):
     """Generează un CNP valid românesc"""
-    # Sex și secol: 1-9
-    # 1,2: bărbat/femeie născut între 1900-1999
-    # 3,4: bărbat/femeie născut între 1800-1899
-    # 5,6: bărbat/femeie născut între 2000-2099
-    # 7,8: bărbați/femei rezidenți
-    # 9: persoane străine
-    sex_secol = random.choices([1, 2, 5, 6], weights=[40, 40, 10, 10])[0]
+    sex_secol = rng.choices(SEXE_SECOLE, weights=PONDERI_SEXE_SECOLE)[0]
+    # Distribuția reală bazată pe populație
+    judet = rng.choices(JUDETE, weights=PONDERI_JUDETE)[0]
+    return genereaza_cnp(sex_secol, judet, rng)
+
 
+def genereaza_cnp(sex_secol, judet, rng=random):
+    """Generează un CNP valid pentru o cifră de sex/secol și un județ date"""
     # Data nașterii
-    if sex_secol in [1, 2]:  # 1900-1999
-        an = random.randint(1950, 1999)
-        an_scurt = str(an % 100).zfill(2)
-    else:  # 2000-2099
-        an = random.randint(2000, 2023)
-        an_scurt = str(an % 100).zfill(2)
+    an = rng.randint(*interval_ani(sex_secol))
+    an_scurt = str(an % 100).zfill(2)
 
-    luna = str(random.randint(1, 12)).zfill(2)
+    luna = str(rng.randint(1, 12)).zfill(2)
 
     # Determinăm numărul de zile în luna respectivă
     if int(luna) in [4, 6, 9, 11]:
@@ -104,71 +1148,10 @@ def genereaza_cnp_valid():
     else:
         max_zile = 31
 
-    zi = str(random.randint(1, max_zile)).zfill(2)
-
-    # Codul județului: 01-52
-    # Distribuția reală bazată pe populație
-    judete = [f"{i:02d}" for i in range(1, 53)]
-    # Ponderi aproximative bazate pe distribuția populației
-    ponderi_judete = [
-        4.5,  # 01-Alba
-        5.7,  # 02-Arad
-        3.8,  # 03-Argeș
-        3.1,  # 04-Bacău
-        2.9,  # 05-Bihor
-        4.3,  # 06-Bistrița-Năsăud
-        2.2,  # 07-Botoșani
-        5.9,  # 08-Brașov
-        3.2,  # 09-Brăila
-        3.1,  # 10-Buzău
-        1.9,  # 11-Caraș-Severin
-        3.0,  # 12-Cluj
-        8.4,  # 13-Constanța
-        2.3,  # 14-Covasna
-        3.9,  # 15-Dâmbovița
-        3.5,  # 16-Dolj
-        3.2,  # 17-Galați
-        3.0,  # 18-Gorj
-        2.2,  # 19-Harghita
-        2.1,  # 20-Hunedoara
-        3.3,  # 21-Ialomița
-        4.0,  # 22-Iași
-        3.1,  # 23-Ilfov
-        2.2,  # 24-Maramureș
-        2.1,  # 25-Mehedinți
-        2.8,  # 26-Mureș
-        2.4,  # 27-Neamț
-        2.3,  # 28-Olt
-        4.0,  # 29-Prahova
-        2.1,  # 30-Satu Mare
-        2.5,  # 31-Sălaj
-        2.6,  # 32-Sibiu
-        3.0,  # 33-Suceava
-        2.2,  # 34-Teleorman
-        3.5,  # 35-Timiș
-        2.0,  # 36-Tulcea
-        2.1,  # 37-Vaslui
-        2.2,  # 38-Vâlcea
-        2.0,  # 39-Vrancea
-        9.5,  # 40-București
-        0.5,  # 41-București S1
-        0.5,  # 42-București S2
-        0.5,  # 43-București S3
-        0.5,  # 44-București S4
-        0.5,  # 45-București S5
-        0.5,  # 46-București S6
-        0.4,  # 47-București S7 (nu mai există)
-        0.4,  # 48-București S8 (nu mai există)
-        0.1,  # 49-51 (rezervate)
-        0.1,
-        0.1,
-        0.1  # 52 (non-rezident)
-    ]
-
-    judet = random.choices(judete[:len(ponderi_judete)], weights=ponderi_judete)[0]
+    zi = str(rng.randint(1, max_zile)).zfill(2)
 
     # Număr de ordine pentru ziua respectivă (3 cifre)
-    nr_ordine = str(random.randint(1, 999)).zfill(3)
+    nr_ordine = str(rng.randint(1, 999)).zfill(3)
 
     # Construim CNP-ul (fără cifra de control)
     cnp_partial = f"{sex_secol}{an_scurt}{luna}{zi}{judet}{nr_ordine}"
@@ -182,7 +1165,87 @@ def genereaza_cnp_valid():
     return cnp
 
 
-def genereaza_nume():
+def genereaza_cnp_lot(numar, samanta=None):
+    """Generează vectorizat numar CNP-uri valide, ca matrice de cifre (numar x 13, uint8).
+
+    Sexul/secolul, data nașterii (cu lungimea corectă a lunii și anii bisecți),
+    județul și numărul de ordine se eșantionează în bloc cu aceleași distribuții
+    ca în genereaza_cnp_valid. Cifra de control se obține ca produs matrice-vector
+    cu ponderile 279146358279, modulo 11 (restul 10 devine 1). CNP-urile nu sunt
+    garantat unice. Necesită NumPy.
+    """
+    if np is None:
+        raise ImportError("genereaza_cnp_lot necesită NumPy")
+    rng = np.random.default_rng(samanta)
+
+    sex_secol = rng.choice(SEXE_SECOLE, size=numar, p=np.divide(PONDERI_SEXE_SECOLE, sum(PONDERI_SEXE_SECOLE)))
+    secol_1900 = sex_secol <= 2
+    an = rng.integers(np.where(secol_1900, 1950, 2000), np.where(secol_1900, 2000, 2024))
+
+    luna = rng.integers(1, 13, size=numar)
+    zile_luna = np.array([0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31])[luna]
+    bisect = ((an % 4 == 0) & (an % 100 != 0)) | (an % 400 == 0)
+    zile_luna += (luna == 2) & bisect
+    zi = rng.integers(1, zile_luna + 1)
+
+    judet = rng.choice(len(JUDETE), size=numar, p=np.divide(PONDERI_JUDETE, sum(PONDERI_JUDETE))) + 1
+    nr_ordine = rng.integers(1, 1000, size=numar)
+
+    cifre = np.empty((numar, 13), dtype=np.uint8)
+    cifre[:, 0] = sex_secol
+    cifre[:, 1], cifre[:, 2] = an % 100 // 10, an % 10
+    cifre[:, 3], cifre[:, 4] = luna // 10, luna % 10
+    cifre[:, 5], cifre[:, 6] = zi // 10, zi % 10
+    cifre[:, 7], cifre[:, 8] = judet // 10, judet % 10
+    cifre[:, 9], cifre[:, 10], cifre[:, 11] = nr_ordine // 100, nr_ordine // 10 % 10, nr_ordine % 10
+
+    ponderi_control = np.array([int(cifra) for cifra in "279146358279"], dtype=np.int64)
+    cifra_control = (cifre[:, :12] @ ponderi_control) % 11
+    cifre[:, 12] = np.where(cifra_control == 10, 1, cifra_control)
+    return cifre
+
+
+def cnp_lot_in_siruri(cifre):
+    """Transformă matricea de cifre dată de genereaza_cnp_lot într-o listă de CNP-uri"""
+    return (cifre + ord('0')).view('S13').ravel().astype(str).tolist()
+
+
+def test_cnp_lot(numar=100000, samanta=None):
+    """Verifică genereaza_cnp_lot față de varianta scalară și îi măsoară debitul.
+
+    Ridică AssertionError dacă vreun CNP are o dată imposibilă, un județ inexistent
+    sau o cifră de control diferită de calculeaza_cifra_control.
+    """
+    import datetime
+
+    timp_start = time.time()
+    cifre = genereaza_cnp_lot(numar, samanta)
+    timp_generare = time.time() - timp_start
+
+    invalide = 0
+    for cnp in cnp_lot_in_siruri(cifre):
+        an = int(cnp[1:3]) + (1900 if cnp[0] in "12" else 2000)
+        try:
+            datetime.date(an, int(cnp[3:5]), int(cnp[5:7]))
+            data_valida = True
+        except ValueError:
+            data_valida = False
+        if (not data_valida or not 1 <= int(cnp[7:9]) <= len(JUDETE)
+                or calculeaza_cifra_control(cnp[:12]) != cnp[12]):
+            invalide += 1
+    if invalide:
+        raise AssertionError(f"genereaza_cnp_lot: {invalide} din {numar} CNP-uri sunt invalide")
+
+    return {
+        'numar_cnp': numar,
+        'timp_generare': timp_generare,
+        'cnp_pe_secunda': numar / timp_generare if timp_generare > 0 else float('inf'),
+        'invalide': invalide,
+        'toate_valide': invalide == 0
+    }
+
+
+def genereaza_nume(rng=random):
     """Generează un nume aleatoriu românesc"""
     prenume_barbati = ["Alexandru", "Andrei", "Adrian", "Bogdan", "Cătălin", "Ciprian", "Claudiu",
                        "Constantin", "Cristian", "Daniel", "David", "Dorin", "Dragoș", "Dumitru",
@@ -210,14 +1273,14 @@ def genereaza_nume():
                     "Stroe", "Tănase", "Toma", "Tudor", "Ungureanu", "Vasile", "Vasilescu", "Vintilă", "Voinea"]
 
     # Determinăm sexul din prima cifră a CNP-ului
-    sex = random.choice(["M", "F"])
+    sex = rng.choice(["M", "F"])
 
     if sex == "M":
-        prenume = random.choice(prenume_barbati)
+        prenume = rng.choice(prenume_barbati)
     else:
-        prenume = random.choice(prenume_femei)
+        prenume = rng.choice(prenume_femei)
 
-    nume = random.choice(nume_familie)
+    nume = rng.choice(nume_familie)
 
     return f"{prenume} {nume}"
 
@@ -246,6 +1309,90 @@ def genereaza_fisier_csv(numar_inregistrari=1000000, nume_fisier="cnp_data.csv")
     return nume_fisier
 
 
+def calculeaza_cote_partitii(numar_inregistrari):
+    """Împarte numărul de înregistrări pe partiții (sex/secol, județ).
+
+    Cotele sunt proporționale cu ponderile din genereaza_cnp_valid și se rotunjesc
+    prin metoda celui mai mare rest, deci sunt deterministe și însumează exact
+    numar_inregistrari. Două partiții diferite nu pot genera același CNP, pentru
+    că prefixul de sex și codul județului fac parte din CNP.
+    """
+    partitii = [(sex_secol, judet, pondere_sex * pondere_judet)
+                for sex_secol, pondere_sex in zip(SEXE_SECOLE, PONDERI_SEXE_SECOLE)
+                for judet, pondere_judet in zip(JUDETE, PONDERI_JUDETE)]
+    total = sum(pondere for _, _, pondere in partitii)
+    exacte = [numar_inregistrari * pondere / total for _, _, pondere in partitii]
+    cote = [int(valoare) for valoare in exacte]
+    dupa_rest = sorted(range(len(partitii)), key=lambda i: exacte[i] - cote[i], reverse=True)
+    for i in dupa_rest[:numar_inregistrari - sum(cote)]:
+        cote[i] += 1
+    return [(sex_secol, judet, cota) for (sex_secol, judet, _), cota in zip(partitii, cote)]
+
+
+def _genereaza_partitie(sarcina):
+    """Generează în fișierul shard CNP-urile unei partiții (rulează într-un proces din pool)"""
+    sex_secol, judet, cota, samanta, cale_shard = sarcina
+    # Sămânța depinde doar de sămânța globală și de partiție, nu de procesul care o execută
+    rng = random.Random(f"{samanta}-{sex_secol}-{judet}")
+
+    an_minim, an_maxim = interval_ani(sex_secol)
+    capacitate = ((an_maxim - an_minim + 1) * 365) * 999
+    if cota > capacitate // 2:
+        raise ValueError(f"Prea multe CNP-uri cerute pentru partiția {sex_secol}/{judet}: {cota}")
+
+    cnp_uri = set()  # Unicitate doar în interiorul partiției
+    with open(cale_shard, 'w', newline='', encoding='utf-8') as fisier:
+        writer = csv.writer(fisier)
+        writer.writerow(["CNP", "Nume"])
+        while len(cnp_uri) < cota:
+            cnp = genereaza_cnp(sex_secol, judet, rng)
+            if cnp not in cnp_uri:
+                cnp_uri.add(cnp)
+                writer.writerow([cnp, genereaza_nume(rng)])
+    return cale_shard, cota
+
+
+def genereaza_fisier_csv_paralel(numar_inregistrari=1000000, nume_fisier="cnp_data.csv", procese=None,
+                                 samanta=0, uneste=True):
+    """Generează fișierul CSV în paralel, pe un pool de procese.
+
+    Spațiul CNP-urilor este împărțit pe partiții (sex/secol, județ), fiecare cu
+    cota și sămânța ei, scrise în fișiere shard separate. Astfel unicitatea se
+    verifică doar în cadrul unei partiții, fără un set global, iar rezultatul
+    depinde numai de sămânță. Cu uneste=True shard-urile sunt concatenate în
+    nume_fisier (un singur antet) și șterse; altfel se returnează lista lor.
+    """
+    import multiprocessing
+    import shutil
+
+    print(f"Generare paralelă {numar_inregistrari} CNP-uri și nume...")
+    sarcini = [(sex_secol, judet, cota, samanta, f"{nume_fisier}.part-{sex_secol}-{judet}")
+               for sex_secol, judet, cota in calculeaza_cote_partitii(numar_inregistrari) if cota > 0]
+    # Partițiile mari primele, ca procesele să termine cam în același timp
+    ordine_executie = sorted(sarcini, key=lambda sarcina: sarcina[2], reverse=True)
+
+    generate = 0
+    with multiprocessing.Pool(procese) as pool:
+        for _, cota in pool.imap_unordered(_genereaza_partitie, ordine_executie):
+            generate += cota
+            print(f"Progres: {generate} CNP-uri generate")
+
+    shard_uri = [sarcina[4] for sarcina in sarcini]
+    if not uneste:
+        return shard_uri
+
+    with open(nume_fisier, 'w', newline='', encoding='utf-8') as fisier:
+        fisier.write("CNP,Nume\r\n")
+        for cale_shard in shard_uri:
+            with open(cale_shard, 'r', newline='', encoding='utf-8') as shard:
+                shard.readline()  # Sărim peste antetul shard-ului
+                shutil.copyfileobj(shard, fisier)
+            os.remove(cale_shard)
+
+    print(f"Fisierul {nume_fisier} a fost generat cu succes!")
+    return nume_fisier
+
+
 def incarca_date_din_csv(nume_fisier):
     """Încarcă datele din fișierul CSV și returnează lista de perechi CNP-nume"""
     date = []
@@ -258,9 +1405,91 @@ def incarca_date_din_csv(nume_fisier):
     return date
 
 
-def populeaza_hash_table(date, dimensiune_tabla=1500000):
-    """Populează tabela hash cu datele din fișierul CSV"""
-    tabla_hash = HashTable(dimensiune_tabla)
+def citeste_csv_pe_bucati(nume_fisier, dimensiune_bucata=100000):
+    """Citește fișierul CSV bucată cu bucată.
+
+    Generează perechi (cnp_uri, nume_uri) de cel mult dimensiune_bucata rânduri,
+    astfel că în memorie se află la un moment dat o singură bucată din fișier.
+    """
+    with open(nume_fisier, 'r', encoding='utf-8', newline='') as fisier:
+        reader = csv.reader(fisier)
+        next(reader)  # Sărim peste antet
+        cnp_uri, nume_uri = [], []
+        for cnp, nume in reader:
+            cnp_uri.append(cnp)
+            nume_uri.append(nume)
+            if len(cnp_uri) == dimensiune_bucata:
+                yield cnp_uri, nume_uri
+                cnp_uri, nume_uri = [], []
+        if cnp_uri:
+            yield cnp_uri, nume_uri
+
+
+def populeaza_din_flux(nume_fisier, tabla_hash=None, dimensiune_bucata=100000, progres=None,
+                       marime_esantion=1000, in_lot=True):
+    """Construiește tabela hash direct din fișier, fără a încărca toate înregistrările.
+
+    Fiecare bucată citită este inserată imediat prin inserare_lot (sau, cu
+    in_lot=False, înregistrare cu înregistrare prin inserare) și apoi eliberată,
+    deci memoria suplimentară este limitată de dimensiune_bucata. După fiecare bucată
+    se apelează progres(inregistrari_procesate, secunde_scurse), dacă este dat.
+    Pe parcurs se păstrează un eșantion uniform de perechi CNP-nume (reservoir
+    sampling, algoritmul L), folosit de test_cautare în locul listei complete.
+    Returnează tabela și eșantionul.
+    """
+    if tabla_hash is None:
+        tabla_hash = HashTableAdresareDeschisa()
+
+    esantion = []
+    # Algoritmul L: următoarea poziție înlocuită se calculează direct, fără
+    # un număr aleator per înregistrare
+    w = math.exp(math.log(random.random()) / marime_esantion)
+    urmatoarea_pozitie = marime_esantion + math.floor(math.log(random.random()) / math.log(1 - w))
+    procesate = 0
+    start_timp = time.time()
+
+    for cnp_uri, nume_uri in citeste_csv_pe_bucati(nume_fisier, dimensiune_bucata):
+        if in_lot:
+            tabla_hash.inserare_lot(cnp_uri, nume_uri)
+        else:
+            for cnp, nume in zip(cnp_uri, nume_uri):
+                tabla_hash.inserare(cnp, nume)
+
+        if len(esantion) < marime_esantion:
+            lipsa = marime_esantion - len(esantion)
+            esantion.extend(zip(cnp_uri[:lipsa], nume_uri[:lipsa]))
+        while urmatoarea_pozitie < procesate + len(cnp_uri):
+            i = urmatoarea_pozitie - procesate
+            esantion[random.randrange(marime_esantion)] = (cnp_uri[i], nume_uri[i])
+            w *= math.exp(math.log(random.random()) / marime_esantion)
+            urmatoarea_pozitie += math.floor(math.log(random.random()) / math.log(1 - w)) + 1
+
+        procesate += len(cnp_uri)
+        if progres is not None:
+            progres(procesate, time.time() - start_timp)
+
+    return tabla_hash, esantion
+
+
+def populeaza_hash_table(date, dimensiune_tabla=DIMENSIUNE_INITIALA, clasa_tabela=HashTable, compara_lot=True):
+    """Populează tabela hash cu datele din fișierul CSV.
+
+    Tabela pornește de la dimensiune_tabla și crește automat peste factorul de
+    încărcare maxim, deci dimensiunea nu trebuie estimată dinainte.
+
+    Cu compara_lot=True se construiește întâi o tabelă prin inserare_lot, doar
+    pentru a-i măsura timpul; ea este eliberată înainte de popularea scalară, ca în
+    memorie să existe o singură tabelă. Se returnează tabela populată scalar.
+    """
+    timp_lot = None
+    if compara_lot:
+        tabla_lot = clasa_tabela(dimensiune_tabla)
+        start_timp = time.time()
+        tabla_lot.inserare_lot([cnp for cnp, _ in date], [nume for _, nume in date])
+        timp_lot = time.time() - start_timp
+        del tabla_lot
+
+    tabla_hash = clasa_tabela(dimensiune_tabla)
 
     start_timp = time.time()
     for cnp, nume in date:
@@ -269,14 +1498,25 @@ def populeaza_hash_table(date, dimensiune_tabla=1500000):
 
     timp_total = sfarsit_timp - start_timp
     print(f"Timpul de populare a tabelei hash: {timp_total:.2f} secunde")
+    if timp_lot is not None:
+        accelerare = timp_total / timp_lot if timp_lot > 0 else float('inf')
+        print(f"Timpul de populare în lot (inserare_lot): {timp_lot:.2f} secunde "
+              f"(accelerare {accelerare:.1f}x)")
 
     return tabla_hash
 
 
-def test_cautare(tabla_hash, date, numar_cautari=1000):
-    """Realizează teste de căutare pe tabela hash"""
-    # Selectăm aleator CNP-uri pentru căutare
-    cnp_uri_de_cautat = random.sample([cnp for cnp, _ in date], numar_cautari)
+def test_cautare(tabla_hash, date, numar_cautari=1000, cnp_uri_de_cautat=None, mod_lot=True):
+    """Realizează teste de căutare pe tabela hash.
+
+    Cu mod_lot=True aceleași chei sunt căutate și printr-un singur apel cautare_lot,
+    iar rezultatele includ debitul (căutări pe secundă) pentru ambele moduri.
+    """
+    # Selectăm aleator CNP-uri pentru căutare (sau folosim lista primită,
+    # ca să comparăm mai multe tabele pe aceleași chei)
+    if cnp_uri_de_cautat is None:
+        cnp_uri_de_cautat = random.sample([cnp for cnp, _ in date], numar_cautari)
+    numar_cautari = len(cnp_uri_de_cautat)
 
     total_iteratii = 0
     iteratii_maxime = 0
@@ -298,56 +1538,386 @@ def test_cautare(tabla_hash, date, numar_cautari=1000):
         'timp_mediu_per_cautare': timp_total / numar_cautari,
         'medie_iteratii': total_iteratii / numar_cautari,
         'iteratii_maxime': iteratii_maxime,
-        'iteratii_minime': iteratii_minime
+        'iteratii_minime': iteratii_minime,
+        'cautari_pe_secunda': numar_cautari / timp_total if timp_total > 0 else float('inf')
     }
 
+    if mod_lot:
+        timp_start = time.time()
+        _, iteratii_lot = tabla_hash.cautare_lot(cnp_uri_de_cautat)
+        timp_lot = time.time() - timp_start
+        rezultate['timp_total_lot'] = timp_lot
+        rezultate['medie_iteratii_lot'] = sum(iteratii_lot) / numar_cautari
+        rezultate['cautari_pe_secunda_lot'] = numar_cautari / timp_lot if timp_lot > 0 else float('inf')
+
     return rezultate
 
 
-def main():
-    # Etapa 1: Generarea datelor
-    nume_fisier = genereaza_fisier_csv(1000000)  # Generăm 1.000.000 de CNP-uri
+def hash_fnv1a(cheie, dimensiune):
+    """FNV-1a pe 64 de biți peste octeții cheii"""
+    valoare_hash = 0xcbf29ce484222325
+    for octet in cheie.encode('utf-8'):
+        valoare_hash = ((valoare_hash ^ octet) * 0x100000001b3) & 0xFFFFFFFFFFFFFFFF
+    return valoare_hash % dimensiune
+
+
+def hash_crc32(cheie, dimensiune):
+    """CRC-32 (zlib) peste octeții cheii"""
+    return zlib.crc32(cheie.encode('utf-8')) % dimensiune
+
+
+def hash_modulo_intreg(cheie, dimensiune):
+    """CNP-ul interpretat ca întreg, modulo dimensiune"""
+    return int(cheie) % dimensiune
+
+
+# None înseamnă funcția proprie a tabelei (polinomial-31, cu varianta vectorizată)
+FUNCTII_HASH = {
+    'polinomial_31': None,
+    'fnv1a': hash_fnv1a,
+    'crc32': hash_crc32,
+    'modulo_intreg': hash_modulo_intreg,
+}
+
+
+def _clasa_cu_functie_hash(clasa_tabela, functie):
+    """Derivă clasa tabelei, înlocuind functie_hash (și functie_hash_lot, scalar)"""
+    def functie_hash(self, cheie, dimensiune=None):
+        return functie(cheie, self.size if dimensiune is None else dimensiune)
+
+    def functie_hash_lot(self, cnp_uri, dimensiune=None):
+        return [functie_hash(self, cnp, dimensiune) for cnp in cnp_uri]
+
+    return type(f"{clasa_tabela.__name__}_{functie.__name__}", (clasa_tabela,),
+                {'functie_hash': functie_hash, 'functie_hash_lot': functie_hash_lot})
+
+
+def _percentila(valori_sortate, procent):
+    return valori_sortate[min(len(valori_sortate) - 1, int(len(valori_sortate) * procent / 100))]
 
-    # Etapa 2: Implementarea și popularea tabelei hash
-    print("\nÎncărcăm datele din fișierul CSV...")
-    date = incarca_date_din_csv(nume_fisier)
-    print(f"Au fost încărcate {len(date)} înregistrări.")
 
-    print("\nPopulăm tabela hash...")
-    tabla_hash = populeaza_hash_table(date)
+def _rss_kb(maxim=False):
+    """RSS-ul curent (sau vârful, cu maxim=True) al procesului, în KiB.
+
+    Pe Linux se citesc VmRSS/VmHWM din /proc, care pornesc de la zero în procesul
+    nou; ru_maxrss ar include și vârful părintelui din care a fost lansat. Pe alte
+    sisteme se folosește ru_maxrss pentru ambele valori.
+    """
+    try:
+        with open('/proc/self/status', encoding='ascii') as fisier:
+            for linie in fisier:
+                if linie.startswith('VmHWM:' if maxim else 'VmRSS:'):
+                    return int(linie.split()[1])
+    except OSError:
+        pass
+    import resource
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def _genereaza_date_benchmark(numar, numar_cautari, samanta, director):
+    """Scrie numar înregistrări sintetice într-un CSV și alege cheile de căutare.
+
+    Rulează în procesul părinte, ca memoria generatorului să nu intre în RSS-ul
+    măsurat al configurațiilor. Returnează calea fișierului, numar_cautari CNP-uri
+    prezente și numar_cautari CNP-uri garantat absente.
+    """
+    rng = random.Random(samanta)
+
+    # Date sintetice: numar CNP-uri unice, plus chei garantat absente pentru ratări
+    cnp_uri = {}
+    while len(cnp_uri) < numar + numar_cautari:
+        if np is not None:
+            lot = cnp_lot_in_siruri(genereaza_cnp_lot(numar + numar_cautari, rng.getrandbits(64)))
+        else:
+            lot = [genereaza_cnp_valid(rng) for _ in range(numar + numar_cautari)]
+        cnp_uri.update(dict.fromkeys(lot))
+    cnp_uri = list(cnp_uri)
+    prezente, absente = cnp_uri[:numar], cnp_uri[numar:numar + numar_cautari]
+    del cnp_uri
+
+    cale = os.path.join(director, f"date_{numar}.csv")
+    with open(cale, 'w', newline='', encoding='utf-8') as fisier:
+        writer = csv.writer(fisier)
+        writer.writerow(["CNP", "Nume"])
+        writer.writerows((cnp, genereaza_nume(rng)) for cnp in prezente)
+    return cale, rng.sample(prezente, min(numar_cautari, numar)), absente
+
+
+def _ruleaza_configuratie(configuratie, fisier_date, gasite, absente):
+    """Măsoară o singură configurație, într-un proces nou.
+
+    Înregistrările sunt citite din fisier_date pe bucăți mici, deci RSS-ul
+    procesului este dominat de tabelă; rss_tabela_kb este vârful RSS peste
+    nivelul măsurat înainte de crearea tabelei.
+    """
+    rng = random.Random(configuratie['samanta'])
+    numar = configuratie['numar_inregistrari']
+    rss_inainte = _rss_kb()
+
+    clasa_tabela = MOTOARE[configuratie['motor']]
+    functie = FUNCTII_HASH[configuratie['functie_hash']]
+    if functie is not None:
+        clasa_tabela = _clasa_cu_functie_hash(clasa_tabela, functie)
+    # Dimensiune fixă, fără creștere automată, ca factorul de încărcare să fie cel cerut
+    dimensiune = max(1, math.ceil(numar / configuratie['factor_incarcare']))
+    tabla_hash = clasa_tabela(dimensiune, factor_incarcare_maxim=None)
+
+    # Se cronometrează doar inserările, nu și citirea fișierului
+    timp_inserare = 0.0
+    for cnp_uri, nume_uri in citeste_csv_pe_bucati(fisier_date, dimensiune_bucata=10000):
+        timp_start = time.perf_counter()
+        for cnp, nume in zip(cnp_uri, nume_uri):
+            tabla_hash.inserare(cnp, nume)
+        timp_inserare += time.perf_counter() - timp_start
+
+    cautari = []
+    for proportie_gasite in configuratie['proportii_gasite']:
+        numar_gasite = round(configuratie['numar_cautari'] * proportie_gasite)
+        chei = gasite[:numar_gasite]
+        chei += absente[:configuratie['numar_cautari'] - len(chei)]
+        rng.shuffle(chei)
+
+        latente = []
+        iteratii_totale = 0
+        for cnp in chei:
+            timp_start = time.perf_counter_ns()
+            _, iteratii = tabla_hash.cautare(cnp)
+            latente.append(time.perf_counter_ns() - timp_start)
+            iteratii_totale += iteratii
+        latente.sort()
+        cautari.append({
+            'proportie_gasite': proportie_gasite,
+            'numar_cautari': len(chei),
+            'latenta_p50_ns': _percentila(latente, 50),
+            'latenta_p99_ns': _percentila(latente, 99),
+            'medie_iteratii': iteratii_totale / max(len(chei), 1),
+        })
 
-    # Afișăm statistici despre tabela hash
     stats = tabla_hash.statistici()
-    print("\nStatistici Hash Table:")
-    print(f"Dimensiune tabelă: {stats['dimensiune']}")
-    print(f"Slot-uri ocupate: {stats['slot_uri_ocupate']}")
-    print(f"Factor de încărcare: {stats['factor_incarcare']:.4f}")
-    print(f"Număr de coliziuni: {stats['coliziuni']}")
-    print(f"Lungimea maximă a unui lanț: {stats['lungime_maxima_lant']}")
-
-    # Etapa 3: Prezentarea rezultatelor statistice
-    print("\nRealizăm 1000 de căutări aleatorii...")
-    rezultate_cautare = test_cautare(tabla_hash, date, 1000)
-
-    print("\nRezultate căutare:")
-    print(f"Număr de căutări: {rezultate_cautare['numar_cautari']}")
-    print(f"Timp total căutare: {rezultate_cautare['timp_total']:.4f} secunde")
-    print(f"Timp mediu per căutare: {rezultate_cautare['timp_mediu_per_cautare'] * 1000:.4f} milisecunde")
-    print(f"Media iterațiilor per căutare: {rezultate_cautare['medie_iteratii']:.2f}")
-    print(f"Număr maxim de iterații: {rezultate_cautare['iteratii_maxime']}")
-    print(f"Număr minim de iterații: {rezultate_cautare['iteratii_minime']}")
-
-
-if __name__ == "__main__":
-    nume_fisier = genereaza_fisier_csv(1000000)
-    date = incarca_date_din_csv(nume_fisier)
-    tabla = populeaza_hash_table(date, dimensiune_tabla=1500000)
-    rezultate = test_cautare(tabla, date)
+    rss_maxim = _rss_kb(maxim=True)
+    return dict(configuratie, **{
+        'dimensiune_tabela': dimensiune,
+        'inserari_pe_secunda': numar / timp_inserare if timp_inserare > 0 else None,
+        'timp_inserare': timp_inserare,
+        'cautari': cautari,
+        'rss_maxim_kb': rss_maxim,
+        'rss_inainte_de_inserare_kb': rss_inainte,
+        'rss_tabela_kb': rss_maxim - rss_inainte,
+        'coliziuni': stats['coliziuni'],
+        'lungime_maxima_lant': stats['lungime_maxima_lant'],
+        'octeti_per_inregistrare': stats['octeti_per_inregistrare'],
+        'histograma_lanturi': {str(lungime): numar for lungime, numar in tabla_hash.histograma_lanturi().items()},
+    })
+
+
+def ruleaza_benchmark(numar_inregistrari=(10000, 100000, 1000000, 10000000), factori_incarcare=(0.5, 0.75, 1.0),
+                      functii_hash=tuple(FUNCTII_HASH), motoare=tuple(MOTOARE), proportii_gasite=(1.0, 0.5, 0.0),
+                      numar_cautari=10000, samanta=0, fisier_rezultate="benchmark_cnp.json"):
+    """Rulează benchmark-ul tabelelor hash pe toate combinațiile date și salvează rezultatele JSON.
+
+    Pentru fiecare combinație (motor, număr de înregistrări, factor de încărcare,
+    funcție de hash) se raportează debitul inserărilor, latențele p50/p99 ale
+    căutărilor pentru fiecare proporție de chei găsite, RSS-ul maxim și histograma
+    lungimilor de lanț. Datele se generează o singură dată per număr de
+    înregistrări, în procesul curent, într-un CSV temporar; fiecare configurație
+    rulează într-un proces nou (spawn, fără memoria părintelui) care citește
+    fișierul pe bucăți, deci rss_tabela_kb reflectă tabela, nu generatorul.
+    Datele depind doar de sămânță, deci rezultatele se pot compara între versiuni.
+    Adresarea deschisă nu suportă factori de încărcare >= 1, care sunt săriți.
+    """
+    import multiprocessing
+    import platform
+    import tempfile
+
+    director = tempfile.TemporaryDirectory(prefix="benchmark_cnp_")
+    date_pe_numar = {}
+    rezultate = []
+    for motor in motoare:
+        for numar in numar_inregistrari:
+            for factor_incarcare in factori_incarcare:
+                if MOTOARE[motor] is HashTableAdresareDeschisa and factor_incarcare >= 1:
+                    continue
+                for functie_hash in functii_hash:
+                    configuratie = {
+                        'motor': motor,
+                        'numar_inregistrari': numar,
+                        'factor_incarcare': factor_incarcare,
+                        'functie_hash': functie_hash,
+                        'proportii_gasite': list(proportii_gasite),
+                        'numar_cautari': numar_cautari,
+                        'samanta': samanta,
+                    }
+                    if numar not in date_pe_numar:
+                        date_pe_numar[numar] = _genereaza_date_benchmark(numar, numar_cautari, samanta,
+                                                                         director.name)
+                    print(f"Benchmark: {motor}, {numar} înregistrări, factor {factor_incarcare}, {functie_hash}")
+                    with multiprocessing.get_context('spawn').Pool(1, maxtasksperchild=1) as pool:
+                        rezultate.append(pool.apply(_ruleaza_configuratie, (configuratie, *date_pe_numar[numar])))
+    director.cleanup()
+
+    raport = {
+        'metadate': {
+            'data': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': platform.python_version(),
+            'platforma': platform.platform(),
+            'numpy': np.__version__ if np is not None else None,
+            'samanta': samanta,
+        },
+        'rezultate': rezultate,
+    }
+    with open(fisier_rezultate, 'w', encoding='utf-8') as fisier:
+        json.dump(raport, fisier, indent=2, ensure_ascii=False)
+    print(f"Rezultatele benchmark-ului au fost salvate în {fisier_rezultate}")
+    return raport
 
-    print("\nStatistici Hash Table:")
-    print(tabla.statistici())
 
-    print("\nRezultate căutare:")
-    for cheie, valoare in rezultate.items():
-        print(f"{cheie}: {valoare}")
+def serveste_din_index(cale_index, cnp_uri=None):
+    """Răspunde la căutări direct din indexul mmap, fără CSV și fără a construi tabela.
+
+    CNP-urile se iau din cnp_uri sau, dacă lista lipsește, câte unul pe linie de la
+    intrarea standard. Pentru fiecare se afișează numele găsit și durata căutării.
+    """
+    start_timp = time.time()
+    with IndexCNPMmap(cale_index) as index:
+        print(f"Indexul {cale_index} ({index.numar_elemente} înregistrări) a fost deschis în "
+              f"{(time.time() - start_timp) * 1000:.2f} milisecunde")
+        for cnp in cnp_uri if cnp_uri else (linie.strip() for linie in sys.stdin):
+            if not cnp:
+                continue
+            if len(cnp) != 13 or not (cnp.isascii() and cnp.isdigit()):
+                # O linie greșită nu trebuie să oprească servirea celorlalte
+                print(f"{cnp}: CNP invalid (sunt necesare 13 cifre)")
+                continue
+            start_timp = time.perf_counter()
+            nume, _ = index.cautare(cnp)
+            print(f"{cnp}: {nume if nume is not None else 'negăsit'} "
+                  f"({(time.perf_counter() - start_timp) * 1000:.3f} milisecunde)")
+
+
+def main(numar_inregistrari=1000000, nume_fisier="cnp_data.csv", regenereaza=False,
+         motoare=('Adresare deschisă',), procese=None, cale_index="cnp_index.bin", compara_lot=True):
+    """Generează (dacă lipsește) fișierul CSV, construiește tabelele din flux și afișează statisticile.
+
+    Valorile implicite sunt cele potrivite pentru fișiere mari: fișierul existent
+    este refolosit, generarea folosește toate procesoarele (procese=1 alege
+    generatorul serial) și se construiește doar tabela cu adresare deschisă.
+    Pentru rulări foarte mari, compara_lot=False sare peste popularea scalară.
+    Indexul binar din cale_index (None = fără index) este rescris la fiecare rulare
+    și poate fi folosit apoi direct de serveste_din_index.
+    """
+    # Etapa 0: Verificarea generatorului vectorizat față de calculeaza_cifra_control
+    if np is not None:
+        rezultat = test_cnp_lot()
+        print(f"Generator vectorizat: {rezultat['numar_cnp']} CNP-uri valide, "
+              f"{rezultat['cnp_pe_secunda']:,.0f} CNP-uri/secundă")
+
+    # Etapa 1: Generarea datelor (un fișier existent poate fi refolosit)
+    if regenereaza or not os.path.exists(nume_fisier):
+        if procese == 1:
+            genereaza_fisier_csv(numar_inregistrari, nume_fisier)
+        else:
+            genereaza_fisier_csv_paralel(numar_inregistrari, nume_fisier, procese)
+
+    # Etapa 2: Implementarea și popularea tabelelor hash, direct din fișier, pe bucăți.
+    # Pentru fișiere foarte mari (zeci de milioane de rânduri) se recomandă doar
+    # motorul cu adresare deschisă, care ocupă câteva zeci de octeți per înregistrare.
+    motoare = {nume_motor: MOTOARE[nume_motor] for nume_motor in motoare}
+
+    def afiseaza_progres(procesate, secunde):
+        print(f"Progres: {procesate} înregistrări indexate ({secunde:.1f} secunde)")
+
+    cnp_uri_de_cautat = None
+    index_salvat = False
+    statistici = {}
+    rezultate = {}
+    for nume_motor, clasa_tabela in motoare.items():
+        timp_scalar = None
+        if compara_lot:
+            # Tabela populată scalar servește doar la măsurare și e eliberată înaintea celei în lot
+            print(f"\nPopulăm tabela hash ({nume_motor}) din {nume_fisier}, înregistrare cu înregistrare...")
+            start_timp = time.time()
+            tabla_hash, _ = populeaza_din_flux(nume_fisier, clasa_tabela(), progres=afiseaza_progres, in_lot=False)
+            timp_scalar = time.time() - start_timp
+            del tabla_hash
+        print(f"\nPopulăm tabela hash ({nume_motor}) din {nume_fisier}...")
+        start_timp = time.time()
+        tabla_hash, esantion = populeaza_din_flux(nume_fisier, clasa_tabela(), progres=afiseaza_progres)
+        timp_lot = time.time() - start_timp
+        if timp_scalar is not None:
+            accelerare = timp_scalar / timp_lot if timp_lot > 0 else float('inf')
+            print(f"Timpul de populare a tabelei hash: {timp_scalar:.2f} secunde")
+            print(f"Timpul de populare în lot (inserare_lot): {timp_lot:.2f} secunde "
+                  f"(accelerare {accelerare:.1f}x)")
+        else:
+            print(f"Timpul de populare a tabelei hash: {timp_lot:.2f} secunde")
+        tabla_hash.construieste_index_prefix()
+        print(f"Timpul de construire a indexului de prefix: {tabla_hash.timp_index_prefix:.2f} secunde")
+        start_timp = time.time()
+        nascuti = tabla_hash.index_prefix.prefix(judet=13, an=1985, luna=3)
+        print(f"Născuți în județul 13 în martie 1985: {len(nascuti)} "
+              f"(interogare în {(time.time() - start_timp) * 1000:.3f} milisecunde)")
+        if cnp_uri_de_cautat is None:
+            # Aceleași chei pentru toate motoarele
+            cnp_uri_de_cautat = [cnp for cnp, _ in esantion]
+        statistici[nume_motor] = tabla_hash.statistici()
+        rezultate[nume_motor] = test_cautare(tabla_hash, esantion, cnp_uri_de_cautat=cnp_uri_de_cautat)
+        if cale_index is not None and not index_salvat:
+            # Toate motoarele conțin aceleași date: indexul se scrie o singură dată,
+            # dar mereu, ca să nu rămână unul construit dintr-un CSV anterior
+            index_salvat = True
+            start_timp = time.time()
+            tabla_hash.salveaza_index(cale_index)
+            print(f"Indexul a fost salvat în {cale_index} ({time.time() - start_timp:.2f} secunde)")
+        del tabla_hash
+
+    if cale_index is not None:
+        # O rulare ulterioară poate răspunde direct din index, fără CSV și fără rehash
+        start_timp = time.time()
+        with IndexCNPMmap(cale_index) as index:
+            nume, _ = index.cautare(cnp_uri_de_cautat[0])
+            timp_pornire = time.time() - start_timp
+            rezultate_index = test_cautare(index, esantion, cnp_uri_de_cautat=cnp_uri_de_cautat, mod_lot=False)
+        print(f"\nIndex mmap: deschidere și prima căutare ({nume}) în {timp_pornire * 1000:.2f} milisecunde")
+        print(f"Index mmap: timp mediu per căutare {rezultate_index['timp_mediu_per_cautare'] * 1000:.4f} milisecunde")
+
+    # Etapa 3: Prezentarea rezultatelor statistice, cele două motoare alăturate
+    def afiseaza(eticheta, valori, format_valoare):
+        print(f"{eticheta:<36}" + "".join(f"{format_valoare(v):>20}" for v in valori))
+
+    stats = list(statistici.values())
+    print("\nStatistici Hash Table:")
+    afiseaza("", motoare, str)
+    afiseaza("Dimensiune tabelă:", [s['dimensiune'] for s in stats], str)
+    afiseaza("Slot-uri ocupate:", [s['slot_uri_ocupate'] for s in stats], str)
+    afiseaza("Factor de încărcare:", [s['factor_incarcare'] for s in stats], "{:.4f}".format)
+    afiseaza("Număr de coliziuni:", [s['coliziuni'] for s in stats], str)
+    afiseaza("Lungimea maximă a unui lanț:", [s['lungime_maxima_lant'] for s in stats], str)
+    afiseaza("Octeți per înregistrare:", [s['octeti_per_inregistrare'] for s in stats], "{:.1f}".format)
+    afiseaza("Capacitate curentă:", [s['capacitate'] for s in stats], str)
+    afiseaza("Redimensionări:", [s['resize_uri'] for s in stats], str)
+    afiseaza("Timp de migrare (s):", [s['timp_migrare'] for s in stats], "{:.4f}".format)
+    afiseaza("Timp index de prefix (s):", [s['timp_index_prefix'] for s in stats], "{:.4f}".format)
+
+    rez = list(rezultate.values())
+    print(f"\nRezultate căutare ({len(cnp_uri_de_cautat)} căutări aleatorii):")
+    afiseaza("", motoare, str)
+    afiseaza("Timp total căutare (s):", [r['timp_total'] for r in rez], "{:.4f}".format)
+    afiseaza("Timp mediu per căutare (ms):", [r['timp_mediu_per_cautare'] * 1000 for r in rez], "{:.4f}".format)
+    afiseaza("Media iterațiilor per căutare:", [r['medie_iteratii'] for r in rez], "{:.2f}".format)
+    afiseaza("Număr maxim de iterații:", [r['iteratii_maxime'] for r in rez], str)
+    afiseaza("Număr minim de iterații:", [r['iteratii_minime'] for r in rez], str)
+    afiseaza("Căutări/secundă (individual):", [r['cautari_pe_secunda'] for r in rez], "{:,.0f}".format)
+    afiseaza("Timp total căutare în lot (s):", [r['timp_total_lot'] for r in rez], "{:.4f}".format)
+    afiseaza("Căutări/secundă (cautare_lot):", [r['cautari_pe_secunda_lot'] for r in rez], "{:,.0f}".format)
+
+
+if __name__ == "__main__" and sys.argv[1:2] == ["benchmark"]:
+    # python "buletin.csv.py" benchmark [fisier_rezultate.json]
+    ruleaza_benchmark(fisier_rezultate=sys.argv[2] if len(sys.argv) > 2 else "benchmark_cnp.json")
+elif __name__ == "__main__" and sys.argv[1:2] == ["cauta"]:
+    # python "buletin.csv.py" cauta [fisier_index] [CNP ...]  (fără CNP-uri: câte unul pe linie, de la stdin)
+    serveste_din_index(sys.argv[2] if len(sys.argv) > 2 else "cnp_index.bin", sys.argv[3:])
+elif __name__ == "__main__":
+    # python "buletin.csv.py" [numar_inregistrari]
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000)
 
@@ -1,10 +1,494 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
+import bisect
 import json
+import re
 import uuid
 import os
+import threading
+import time
 
 DATA_FILE = "books.json"
+JOURNAL_FILE = "books.journal"
+COMPACT_EVERY = 1000  # Numărul de înregistrări din jurnal după care se pornește compactarea
+VIRTUAL_THRESHOLD = 5000  # Peste acest număr de cărți lista se afișează virtual, pe ferestre
+VIRTUAL_BUFFER = 5  # Rânduri în plus față de cele vizibile, păstrate în Treeview
+ROW_HEIGHT = 25  # Înălțimea unui rând din Treeview, în pixeli
+SEARCH_DELAY_MS = 250  # Pauza de tastare după care se pornește căutarea
+SEARCH_POLL_MS = 20  # Cât de des verifică firul Tk dacă s-a terminat căutarea
+
+
+class BookStore:
+    """Stocarea catalogului: un snapshot JSON plus un jurnal de modificări (write-ahead log).
+
+    Fiecare adăugare, editare sau ștergere se scrie ca o singură linie JSON la
+    sfârșitul jurnalului, în loc să rescrie tot fișierul. După compact_every
+    înregistrări, un fir de fundal redenumește jurnalul în .old, începe unul nou și
+    îl pliază în snapshot (scris alături și înlocuit atomic cu os.replace). Reluarea
+    jurnalului este idempotentă: add/update înlocuiesc cartea cu același id, iar delete
+    o elimină, deci o compactare întreruptă poate fi reluată fără dubluri.
+    """
+
+    def __init__(self, snapshot_path=DATA_FILE, journal_path=JOURNAL_FILE, compact_every=COMPACT_EVERY):
+        self.snapshot_path = snapshot_path
+        self.journal_path = journal_path
+        self.compact_every = compact_every
+        self.lock = threading.Lock()
+        self.journal = None
+        self.records = 0
+        self.compaction = None
+        self.compaction_error = None  # Excepția ultimei compactări eșuate, dacă există
+
+    @staticmethod
+    def apply(books_by_id, record):
+        """Aplică o înregistrare din jurnal peste dicționarul id -> carte.
+
+        Dicționarul păstrează ordinea inserării, deci o carte editată rămâne pe locul
+        ei, iar una nouă ajunge la sfârșit, exact ca în BookCatalog.
+        """
+        if record["op"] == "delete":
+            books_by_id.pop(record["id"], None)
+        else:
+            books_by_id[record["book"]["id"]] = record["book"]
+
+    def _read_snapshot(self):
+        if not os.path.exists(self.snapshot_path):
+            return []
+        with open(self.snapshot_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if not isinstance(data, list):
+            raise ValueError("Formatul fișierului de date este incorect.")
+        return data
+
+    def _replay(self, books_by_id, path):
+        """Reia un jurnal peste books_by_id; liniile care nu sunt JSON valid sunt sărite."""
+        if not os.path.exists(path):
+            return 0
+        count = 0
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                self.apply(books_by_id, record)
+                count += 1
+        return count
+
+    @staticmethod
+    def _trim_torn_tail(path):
+        """Taie o ultimă linie scrisă pe jumătate (fără \\n) de la sfârșitul jurnalului.
+
+        Altfel următoarea înregistrare adăugată s-ar lipi de ea și s-ar pierde la reluare.
+        """
+        if not os.path.exists(path):
+            return
+        with open(path, "rb+") as f:
+            position = f.seek(0, os.SEEK_END)
+            if position == 0:
+                return
+            f.seek(position - 1)
+            if f.read(1) == b"\n":
+                return
+            while position > 0:
+                step = min(4096, position)
+                position -= step
+                f.seek(position)
+                newline = f.read(step).rfind(b"\n")
+                if newline >= 0:
+                    f.truncate(position + newline + 1)
+                    return
+            f.truncate(0)
+
+    def load(self):
+        """Returnează dicționarul id -> carte: snapshot-ul plus jurnalele nepliate încă.
+
+        Dicționarul păstrează ordinea catalogului și poate fi preluat direct de
+        BookCatalog, fără copiere. Ridică json.JSONDecodeError sau ValueError dacă snapshot-ul este corupt.
+        """
+        books_by_id = {book["id"]: book for book in self._read_snapshot()}
+        self._replay(books_by_id, self.journal_path + ".old")
+        # Jurnalul curent se redeschide în modul "a": întâi tăiem o linie ruptă de o oprire bruscă
+        self._trim_torn_tail(self.journal_path)
+        self.records = self._replay(books_by_id, self.journal_path)
+        self.journal = open(self.journal_path, "a", encoding="utf-8")
+        if os.path.exists(self.journal_path + ".old"):
+            # O compactare anterioară a fost întreruptă; o terminăm înainte de următoarea rotire
+            self._start_compaction()
+        return books_by_id
+
+    def quarantine_snapshot(self):
+        """Mută un snapshot corupt deoparte (.corrupt) și returnează noua cale.
+
+        Jurnalele nu sunt atinse: un load() ulterior le reia peste un catalog gol.
+        """
+        corrupt_path = self.snapshot_path + ".corrupt"
+        if os.path.exists(corrupt_path):
+            corrupt_path = f"{corrupt_path}.{int(time.time())}"
+        os.replace(self.snapshot_path, corrupt_path)
+        return corrupt_path
+
+    def append(self, op, book):
+        """Scrie o modificare în jurnal: op este "add", "update" sau "delete"."""
+        if op == "delete":
+            record = {"op": op, "id": book["id"]}
+        else:
+            record = {"op": op, "book": book}
+        with self.lock:
+            self.journal.write(json.dumps(record, ensure_ascii=False) + "\n")
+            self.journal.flush()
+            self.records += 1
+            if self.records >= self.compact_every and (self.compaction is None or not self.compaction.is_alive()):
+                if os.path.exists(self.journal_path + ".old"):
+                    # Compactarea anterioară a eșuat și .old nu a fost pliat: nu-l suprascriem,
+                    # ci o reluăm, cel mult o dată la compact_every înregistrări
+                    self.records = 0
+                else:
+                    self._rotate()
+                self._start_compaction()
+
+    def _rotate(self):
+        """Mută jurnalul curent în .old și deschide unul gol; se apelează cu lock-ul luat."""
+        self.journal.close()
+        os.replace(self.journal_path, self.journal_path + ".old")
+        self.journal = open(self.journal_path, "a", encoding="utf-8")
+        self.records = 0
+
+    def _write_snapshot(self, books):
+        temporary = self.snapshot_path + ".tmp"
+        with open(temporary, "w", encoding="utf-8") as f:
+            json.dump(books, f, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporary, self.snapshot_path)
+
+    def _start_compaction(self):
+        self.compaction = threading.Thread(target=self._compact, daemon=True)
+        self.compaction.start()
+
+    def _compact(self):
+        """Pliază jurnalul .old în snapshot; rulează pe firul de fundal.
+
+        La eroare .old rămâne pe disc și excepția se păstrează în compaction_error.
+        """
+        try:
+            books_by_id = {book["id"]: book for book in self._read_snapshot()}
+            self._replay(books_by_id, self.journal_path + ".old")
+            self._write_snapshot(list(books_by_id.values()))
+            os.remove(self.journal_path + ".old")
+            self.compaction_error = None
+        except (OSError, ValueError) as error:
+            self.compaction_error = error
+
+    def wait(self):
+        """Așteaptă terminarea unei compactări în curs."""
+        if self.compaction is not None:
+            self.compaction.join()
+
+    def close(self):
+        self.wait()
+        with self.lock:
+            if self.journal is not None:
+                self.journal.close()
+                self.journal = None
+
+
+class BookCatalog:
+    """Catalogul în memorie: id -> carte, în ordinea inserării, plus indexuri pe autor și an.
+
+    Indexurile secundare țin pentru fiecare autor și fiecare an id-urile cărților
+    (ca dicționare cu valori None, deci mulțimi) și sunt actualizate de add, update
+    și delete, astfel că fiecare operație pe o carte este O(1). Iterarea întoarce
+    cărțile în ordinea în care au fost adăugate; order ține numărul de ordine al
+    fiecărui id, ca interogările pe indexuri să întoarcă tot ordinea catalogului.
+
+    Un dicționar id -> carte (cum îl dă BookStore.load) este preluat ca atare, iar
+    order și indexurile se construiesc abia la prima interogare care are nevoie de
+    ele; până atunci add, update și delete ating doar dicționarul.
+    """
+
+    def __init__(self, books=()):
+        self.books = {}
+        self.order = {}
+        self.by_author = {}
+        self.by_year = {}
+        self._next_order = 0
+        self.indexed = True
+        if isinstance(books, dict):
+            self.books = books
+            self.indexed = not books
+        else:
+            for book in books:
+                self.add(book)
+
+    def __len__(self):
+        return len(self.books)
+
+    def __iter__(self):
+        return iter(self.books.values())
+
+    def __contains__(self, book_id):
+        return book_id in self.books
+
+    def get(self, book_id):
+        return self.books.get(book_id)
+
+    def _build_indexes(self):
+        """Construiește order, by_author și by_year din cărțile existente, o singură dată."""
+        if self.indexed:
+            return
+        self.order = {book_id: position for position, book_id in enumerate(self.books)}
+        self._next_order = len(self.order)
+        for book in self.books.values():
+            self._index(book)
+        self.indexed = True
+
+    def _index(self, book):
+        self.by_author.setdefault(book.get("author"), {})[book["id"]] = None
+        self.by_year.setdefault(book.get("year"), {})[book["id"]] = None
+
+    def _unindex(self, book):
+        for index, key in ((self.by_author, book.get("author")), (self.by_year, book.get("year"))):
+            ids = index.get(key)
+            if ids is not None:
+                ids.pop(book["id"], None)
+                if not ids:
+                    del index[key]
+
+    def add(self, book):
+        """Adaugă o carte la sfârșit; un id existent este tratat ca editare."""
+        if book["id"] in self.books:
+            self.update(book)
+            return
+        self.books[book["id"]] = book
+        if self.indexed:
+            self.order[book["id"]] = self._next_order
+            self._next_order += 1
+            self._index(book)
+
+    def update(self, book):
+        """Înlocuiește cartea cu același id, fără să-i schimbe poziția."""
+        old_book = self.books.get(book["id"])
+        if old_book is None:
+            return
+        self.books[book["id"]] = book
+        if not self.indexed:
+            return
+        if old_book.get("author") != book.get("author") or old_book.get("year") != book.get("year"):
+            self._unindex(old_book)
+            self._index(book)
+
+    def delete(self, book_id):
+        """Șterge cartea cu id-ul dat și o returnează (None dacă nu există)."""
+        book = self.books.pop(book_id, None)
+        if book is not None and self.indexed:
+            del self.order[book_id]
+            self._unindex(book)
+        return book
+
+    def _in_order(self, ids):
+        return [self.books[book_id] for book_id in sorted(ids, key=self.order.__getitem__)]
+
+    def books_by_author(self, author):
+        self._build_indexes()
+        return self._in_order(self.by_author.get(author, ()))
+
+    def books_by_year(self, year):
+        self._build_indexes()
+        return self._in_order(self.by_year.get(year, ()))
+
+
+class BookSearchIndex:
+    """Index inversat pentru căutarea după titlu, autor și ISBN.
+
+    postings ține pentru fiecare token (cuvânt în litere mici; ISBN-ul fără
+    cratime) id-urile cărților care îl conțin. Un termen din căutare se potrivește
+    cu tokenii care încep cu el (căutare binară în vocabularul sortat) și, de la 3
+    caractere, cu tokenii nenumerici care îl conțin, găsiți prin indexul de
+    trigrame al vocabularului. Termenii se combină cu ȘI. Căutarea rulează pe alt
+    fir decât modificările, deci toate metodele publice iau lock-ul.
+
+    Construirea inițială (build_in_background) lucrează pe structuri locale, fără
+    lock; add/remove apelate între timp sunt puse în pending și reluate după ce
+    indexul construit este instalat, iar căutările așteaptă evenimentul ready.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.postings = {}  # token -> id-urile cărților (dicționar cu valori None)
+        self.vocabulary = []  # Tokenii din postings, sortați
+        self.trigrams = {}  # trigramă -> tokenii nenumerici care o conțin
+        self.tokens_by_id = {}  # id -> tokenii cărții, ca ștergerea să nu depindă de dicționarul cărții
+        self.order = {}  # id -> numărul de ordine, ca rezultatele să urmeze ordinea catalogului
+        self._next_order = 0
+        self.building = False
+        self.pending = []  # (operație, argument) primite în timpul construirii
+        self.ready = threading.Event()
+        self.ready.set()
+
+    @staticmethod
+    def tokenize(text):
+        """Împarte textul în tokeni; cratimele dintre cifre se elimină (978-3-16 -> 978316)."""
+        return re.findall(r"\w+", re.sub(r"(?<=\d)-(?=\d)", "", str(text).lower()))
+
+    @classmethod
+    def book_tokens(cls, book):
+        return tuple(set(cls.tokenize(" ".join(
+            str(book.get(field, "")) for field in ("title", "author", "isbn")))))
+
+    @staticmethod
+    def _token_trigrams(token):
+        if len(token) < 3 or token.isdigit():
+            return ()
+        return {token[i:i + 3] for i in range(len(token) - 2)}
+
+    def _add_token(self, token, book_id):
+        ids = self.postings.get(token)
+        if ids is None:
+            ids = self.postings[token] = {}
+            bisect.insort(self.vocabulary, token)
+            for trigram in self._token_trigrams(token):
+                self.trigrams.setdefault(trigram, set()).add(token)
+        ids[book_id] = None
+
+    def _remove_token(self, token, book_id):
+        ids = self.postings.get(token)
+        if ids is None:
+            return
+        ids.pop(book_id, None)
+        if ids:
+            return
+        del self.postings[token]
+        del self.vocabulary[bisect.bisect_left(self.vocabulary, token)]
+        for trigram in self._token_trigrams(token):
+            tokens = self.trigrams[trigram]
+            tokens.discard(token)
+            if not tokens:
+                del self.trigrams[trigram]
+
+    def _remove(self, book_id):
+        for token in self.tokens_by_id.pop(book_id, ()):
+            self._remove_token(token, book_id)
+
+    def build_in_background(self, books):
+        """Pornește build pe un fir de fundal cu o copie a listei de cărți.
+
+        Copia și trecerea în modul building se fac pe firul apelant, deci orice
+        modificare ulterioară a catalogului ajunge în pending.
+        """
+        with self.lock:
+            self.building = True
+            self.pending = []
+            self.ready.clear()
+        thread = threading.Thread(target=self.build, args=(list(books),), daemon=True)
+        thread.start()
+        return thread
+
+    def build(self, books):
+        """Înlocuiește conținutul indexului cu toate cărțile date (o singură sortare a vocabularului).
+
+        Lock-ul este luat doar la instalarea rezultatului, ca add/remove să nu
+        aștepte toată construirea.
+        """
+        with self.lock:
+            if not self.building:
+                self.building = True
+                self.pending = []
+                self.ready.clear()
+        postings = {}
+        tokens_by_id = {}
+        order = {}
+        for book in books:
+            book_id = book["id"]
+            tokens = self.book_tokens(book)
+            if book_id not in order:
+                order[book_id] = len(order)
+            tokens_by_id[book_id] = tokens
+            for token in tokens:
+                postings.setdefault(token, {})[book_id] = None
+        vocabulary = sorted(postings)
+        trigrams = {}
+        for token in vocabulary:
+            for trigram in self._token_trigrams(token):
+                trigrams.setdefault(trigram, set()).add(token)
+
+        with self.lock:
+            self.postings, self.vocabulary, self.trigrams = postings, vocabulary, trigrams
+            self.tokens_by_id, self.order, self._next_order = tokens_by_id, order, len(order)
+            for operation, argument in self.pending:
+                if operation == "add":
+                    self._add(argument)
+                else:
+                    self._remove_book(argument)
+            self.pending = []
+            self.building = False
+        self.ready.set()
+
+    def _add(self, book):
+        book_id = book["id"]
+        self._remove(book_id)
+        if book_id not in self.order:
+            self.order[book_id] = self._next_order
+            self._next_order += 1
+        tokens = self.book_tokens(book)
+        self.tokens_by_id[book_id] = tokens
+        for token in tokens:
+            self._add_token(token, book_id)
+
+    def _remove_book(self, book_id):
+        self._remove(book_id)
+        self.order.pop(book_id, None)
+
+    def add(self, book):
+        """Indexează o carte; un id existent este reindexat fără să-și piardă poziția."""
+        with self.lock:
+            if self.building:
+                self.pending.append(("add", book))
+            else:
+                self._add(book)
+
+    def remove(self, book_id):
+        with self.lock:
+            if self.building:
+                self.pending.append(("remove", book_id))
+            else:
+                self._remove_book(book_id)
+
+    def _matching_tokens(self, term):
+        """Tokenii care încep cu termenul sau (de la 3 caractere) îl conțin."""
+        tokens = set()
+        i = bisect.bisect_left(self.vocabulary, term)
+        while i < len(self.vocabulary) and self.vocabulary[i].startswith(term):
+            tokens.add(self.vocabulary[i])
+            i += 1
+        trigrams = self._token_trigrams(term)
+        if trigrams:
+            candidates = sorted((self.trigrams.get(trigram, set()) for trigram in trigrams), key=len)
+            tokens.update(token for token in set.intersection(*candidates) if term in token)
+        return tokens
+
+    def search(self, query):
+        """Id-urile cărților care se potrivesc cu toți termenii, în ordinea catalogului.
+
+        Returnează None pentru o căutare goală (adică toate cărțile).
+        """
+        terms = self.tokenize(query)
+        if not terms:
+            return None
+        self.ready.wait()  # Rulează pe un fir de lucru, deci poate aștepta construirea
+        with self.lock:
+            result = None
+            # Termenii lungi au de obicei mai puține potriviri, deci intersecția scade repede
+            for term in sorted(set(terms), key=len, reverse=True):
+                ids = set()
+                for token in self._matching_tokens(term):
+                    ids.update(self.postings[token])
+                result = ids if result is None else result & ids
+                if not result:
+                    return []
+            if len(result) > len(self.order) // 8:
+                return [book_id for book_id in self.order if book_id in result]
+            return sorted(result, key=self.order.__getitem__)
 
 
 class BookForm(tk.Toplevel):
@@ -112,35 +596,39 @@ class BookManagerApp:
         self.root.geometry("800x500")
         self.root.minsize(600, 400)
 
-        self.books_data = self._load_books()
+        self.store = BookStore()
+        self.catalog = BookCatalog(self._load_books())
+        self.ui_timings = {}  # operație -> (număr de actualizări, timp total în secunde)
+        # În modul virtual Treeview conține doar fereastra vizibilă din view_ids
+        self.virtual = len(self.catalog) > VIRTUAL_THRESHOLD
+        self.view_ids = list(self.catalog.books) if self.virtual else None
+        self.view_top = 0  # Indexul din view_ids al primului rând afișat
+        self.view_dead = 0  # Id-uri șterse rămase în view_ids, sărite la afișare
+        self.search_index = BookSearchIndex()
+        self._search_after = None  # Căutarea programată de ultima tastă (root.after)
+        self._search_generation = 0  # Rezultatele unei căutări mai vechi sunt ignorate
 
         self._setup_main_ui()  # Aici este corecția relevantă
         self._refresh_book_list()
+        # Indexul de căutare se construiește pe un fir de fundal, ca fereastra să apară imediat
+        self.search_index.build_in_background(self.catalog)
 
     def _load_books(self):
-        """Încarcă cărțile din fișierul JSON."""
-        if not os.path.exists(DATA_FILE):
-            return []
+        """Încarcă cărțile (dicționar id -> carte) din snapshot-ul JSON și reia jurnalul de modificări."""
         try:
-            with open(DATA_FILE, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                if isinstance(data, list):
-                    return data
-                else:
-                    messagebox.showwarning("Atenție",
-                                           "Formatul fișierului de date este incorect. Se va crea un fișier nou.",
-                                           parent=self.root)
-                    return []
-        except (json.JSONDecodeError, FileNotFoundError):
-            messagebox.showwarning("Atenție Date", "Fișierul de date este gol sau corupt. Se începe cu o listă goală.",
+            return self.store.load()
+        except ValueError:  # Include json.JSONDecodeError
+            corrupt_path = self.store.quarantine_snapshot()
+            messagebox.showwarning("Atenție Date",
+                                   f"Fișierul de date este gol sau corupt și a fost mutat în {corrupt_path}. "
+                                   "Se încarcă doar modificările din jurnal.",
                                    parent=self.root)
-            return []
+        return self.store.load()
 
-    def _save_books(self):
-        """Salvează lista curentă de cărți în fișierul JSON."""
+    def _save_change(self, op, book_data):
+        """Scrie o singură modificare în jurnal, în loc să rescrie tot fișierul."""
         try:
-            with open(DATA_FILE, "w", encoding="utf-8") as f:
-                json.dump(self.books_data, f, indent=4, ensure_ascii=False)
+            self.store.append(op, book_data)
         except IOError:
             messagebox.showerror("Eroare Salvare", "Nu s-au putut salva datele în fișier.", parent=self.root)
 
@@ -150,7 +638,7 @@ class BookManagerApp:
         style.theme_use('clam')
         style.configure("Treeview.Heading", font=('Helvetica', 10, 'bold'))
         style.configure("TButton", padding=6, relief="flat", font=('Helvetica', 9))
-        style.configure("Treeview", rowheight=25, font=('Helvetica', 9))
+        style.configure("Treeview", rowheight=ROW_HEIGHT, font=('Helvetica', 9))
 
         main_frame = ttk.Frame(self.root, padding="10")
         main_frame.pack(expand=True, fill=tk.BOTH)
@@ -169,6 +657,16 @@ class BookManagerApp:
                                         state=tk.DISABLED)
         self.delete_button.pack(side=tk.LEFT, padx=5)
 
+        self.search_var = tk.StringVar()
+        self.search_var.trace_add("write", lambda *args: self._schedule_search())
+        search_entry = ttk.Entry(controls_frame, textvariable=self.search_var, width=30)
+        search_entry.pack(side=tk.RIGHT, padx=5)
+        ttk.Label(controls_frame, text="🔍 Caută:").pack(side=tk.RIGHT)
+
+        # Bara de stare: numărul de cărți și costul ultimei actualizări a listei
+        self.status_label = ttk.Label(main_frame, anchor="w")
+        self.status_label.pack(side=tk.BOTTOM, fill=tk.X, pady=(5, 0))
+
         list_frame = ttk.Frame(main_frame)
         list_frame.pack(expand=True, fill=tk.BOTH)
 
@@ -202,33 +700,225 @@ class BookManagerApp:
         # Linia "self.book_tree.column("id", display=tk.FALSE)" a fost eliminată.
         # --- SFÂRȘIT CORECȚIE ---
 
-        scrollbar_y = ttk.Scrollbar(list_frame, orient=tk.VERTICAL, command=self.book_tree.yview)
+        self.scrollbar_y = ttk.Scrollbar(list_frame, orient=tk.VERTICAL, command=self.book_tree.yview)
         scrollbar_x = ttk.Scrollbar(list_frame, orient=tk.HORIZONTAL, command=self.book_tree.xview)
-        self.book_tree.configure(yscrollcommand=scrollbar_y.set, xscrollcommand=scrollbar_x.set)
+        self.book_tree.configure(yscrollcommand=self.scrollbar_y.set, xscrollcommand=scrollbar_x.set)
+        if self.virtual:
+            self._setup_virtual_scroll()
 
-        scrollbar_y.pack(side=tk.RIGHT, fill=tk.Y)
+        self.scrollbar_y.pack(side=tk.RIGHT, fill=tk.Y)
         scrollbar_x.pack(side=tk.BOTTOM, fill=tk.X)
         self.book_tree.pack(expand=True, fill=tk.BOTH)
 
         self.book_tree.bind("<<TreeviewSelect>>", self._on_book_select)
         self.book_tree.bind("<Double-1>", lambda event: self._edit_book() if self.book_tree.selection() else None)
 
+    @staticmethod
+    def _book_values(book):
+        """Valorile unui rând; trebuie să corespundă cu ordinea și numărul din self.all_data_columns."""
+        return (
+            book["id"],
+            book.get("title", "N/A"),
+            book.get("author", "N/A"),
+            book.get("year", "N/A"),
+            book.get("isbn", "N/A")
+        )
+
+    def _record_ui_time(self, operation, start):
+        """Adaugă durata unei actualizări a listei la contoare și o afișează în bara de stare."""
+        elapsed = time.perf_counter() - start
+        count, total = self.ui_timings.get(operation, (0, 0.0))
+        count, total = count + 1, total + elapsed
+        self.ui_timings[operation] = (count, total)
+        self.status_label.config(
+            text=f"{len(self.catalog)} cărți | {operation}: {elapsed * 1000:.2f} ms "
+                 f"(medie {total / count * 1000:.2f} ms din {count} operații)")
+
+    def _setup_virtual_scroll(self):
+        """Preia derularea verticală: bara și rotița mută fereastra din view_ids, nu Treeview."""
+        self.scrollbar_y.config(command=self._on_virtual_scroll)
+        self.book_tree.configure(yscrollcommand="")
+        self.book_tree.bind("<MouseWheel>", self._on_virtual_wheel)
+        self.book_tree.bind("<Button-4>", self._on_virtual_wheel)
+        self.book_tree.bind("<Button-5>", self._on_virtual_wheel)
+        # La redimensionare se schimbă numărul de rânduri vizibile
+        self.book_tree.bind("<Configure>", lambda event: self._render_window())
+
+    def _enable_virtual_view(self):
+        """Trece în modul virtual (catalog crescut peste prag sau prima căutare)."""
+        self.virtual = True
+        self.view_ids = list(self.catalog.books)
+        self.view_dead = 0
+        self._setup_virtual_scroll()
+
+    def _visible_rows(self):
+        """Numărul de rânduri care încap în Treeview (fără antet)."""
+        return max(1, self.book_tree.winfo_height() // ROW_HEIGHT - 1)
+
+    def _render_window(self):
+        """Înlocuiește rândurile din Treeview cu fereastra care începe la view_top.
+
+        Treeview păstrează doar rândurile vizibile plus VIRTUAL_BUFFER, deci costul
+        nu depinde de mărimea catalogului. Selecția se păstrează dacă rândul selectat
+        rămâne în fereastră. Id-urile șterse din view_ids (vezi _delete_row) sunt sărite.
+        """
+        total = len(self.view_ids)
+        visible = self._visible_rows()
+        self.view_top = max(0, min(self.view_top, total - visible))
+        window = []
+        position = self.view_top
+        while position < total and len(window) < visible + VIRTUAL_BUFFER:
+            if self.view_ids[position] in self.catalog:
+                window.append(self.view_ids[position])
+            position += 1
+
+        selection = self.book_tree.selection()
+        self.book_tree.delete(*self.book_tree.get_children())
+        for book_id in window:
+            self.book_tree.insert("", tk.END, iid=book_id, values=self._book_values(self.catalog.get(book_id)))
+        if selection and self.book_tree.exists(selection[0]):
+            self.book_tree.selection_set(selection[0])
+
+        if total:
+            self.scrollbar_y.set(self.view_top / total, min(1.0, (self.view_top + visible) / total))
+        else:
+            self.scrollbar_y.set(0.0, 1.0)
+
+    def _on_virtual_scroll(self, action, amount, unit=None):
+        """Comanda barei de derulare în modul virtual ("moveto" fracție / "scroll" n units|pages)."""
+        start = time.perf_counter()
+        if action == "moveto":
+            self.view_top = int(float(amount) * len(self.view_ids))
+        elif action == "scroll":
+            step = self._visible_rows() if unit == "pages" else 1
+            self.view_top += int(amount) * step
+        self._render_window()
+        self._record_ui_time("derulare", start)
+
+    def _on_virtual_wheel(self, event):
+        """Rotița mouse-ului: 3 rânduri pe pas (Windows/macOS trimit delta, X11 Button-4/5)."""
+        if event.num == 4 or event.delta > 0:
+            self._on_virtual_scroll("scroll", -3, "units")
+        else:
+            self._on_virtual_scroll("scroll", 3, "units")
+        return "break"  # Treeview nu trebuie să-și deruleze singur rândurile
+
     def _refresh_book_list(self):
-        """Șterge și repopulează lista de cărți în Treeview."""
+        """Șterge și repopulează lista de cărți în Treeview (doar la încărcarea inițială).
+
+        În modul virtual se afișează doar prima fereastră de rânduri.
+        """
+        start = time.perf_counter()
         self.edit_button.config(state=tk.DISABLED)
         self.delete_button.config(state=tk.DISABLED)
 
-        for item in self.book_tree.get_children():
-            self.book_tree.delete(item)
-        for book in self.books_data:
-            # Valorile trebuie să corespundă cu ordinea și numărul din self.all_data_columns
-            self.book_tree.insert("", tk.END, iid=book["id"], values=(
-                book["id"],
-                book.get("title", "N/A"),
-                book.get("author", "N/A"),
-                book.get("year", "N/A"),
-                book.get("isbn", "N/A")
-            ))
+        if self.virtual:
+            self.view_top = 0
+            self._render_window()
+        else:
+            self.book_tree.delete(*self.book_tree.get_children())
+            for book in self.catalog:
+                self.book_tree.insert("", tk.END, iid=book["id"], values=self._book_values(book))
+        self._record_ui_time("reconstruire", start)
+
+    def _insert_row(self, book):
+        """Adaugă un singur rând la sfârșitul listei."""
+        start = time.perf_counter()
+        if not self.virtual and len(self.catalog) > VIRTUAL_THRESHOLD:
+            # view_ids conține deja cartea nouă; derulăm la sfârșit ca să fie vizibilă
+            self._enable_virtual_view()
+            self.view_top = len(self.view_ids)
+            self._render_window()
+        elif self.virtual:
+            self.view_ids.append(book["id"])
+            self._render_window()
+        else:
+            self.book_tree.insert("", tk.END, iid=book["id"], values=self._book_values(book))
+        self._record_ui_time("adăugare", start)
+        self._refresh_search()
+
+    def _update_row(self, book):
+        """Actualizează valorile rândului unei cărți, fără să-l mute."""
+        start = time.perf_counter()
+        # În modul virtual rândul există doar dacă e în fereastra afișată
+        if self.book_tree.exists(book["id"]):
+            self.book_tree.item(book["id"], values=self._book_values(book))
+        self._record_ui_time("editare", start)
+        self._refresh_search()
+
+    def _delete_row(self, book_id):
+        """Șterge rândul unei cărți; restul listei și poziția de derulare rămân neschimbate.
+
+        În modul virtual id-ul rămâne în view_ids (căutarea lui ar fi O(n)) și este
+        sărit la afișare; lista se compactează când un sfert din ea e ștearsă.
+        """
+        start = time.perf_counter()
+        if self.virtual:
+            self.view_dead += 1
+            if self.view_dead > len(self.view_ids) // 4:
+                self.view_ids = [view_id for view_id in self.view_ids if view_id in self.catalog]
+                self.view_dead = 0
+            self._render_window()
+        else:
+            self.book_tree.delete(book_id)
+        self._record_ui_time("ștergere", start)
+        self._on_book_select()
+
+    def _schedule_search(self):
+        """Amână căutarea până când utilizatorul se oprește din tastat SEARCH_DELAY_MS."""
+        if self._search_after is not None:
+            self.root.after_cancel(self._search_after)
+        self._search_after = self.root.after(SEARCH_DELAY_MS, self._start_search)
+
+    def _refresh_search(self):
+        """După o modificare, refă căutarea activă (cartea poate să nu se mai potrivească)."""
+        if self.search_var.get().strip():
+            self._schedule_search()
+
+    def _start_search(self):
+        """Rulează căutarea pe un fir separat; firul Tk doar verifică periodic rezultatul."""
+        self._search_after = None
+        self._search_generation += 1
+        query = self.search_var.get()
+        result = {}
+
+        def worker():
+            start = time.perf_counter()
+            result["ids"] = self.search_index.search(query)
+            result["elapsed"] = time.perf_counter() - start
+
+        thread = threading.Thread(target=worker, daemon=True)
+        thread.start()
+        self.root.after(SEARCH_POLL_MS, self._poll_search, thread, result, self._search_generation)
+
+    def _poll_search(self, thread, result, generation):
+        if thread.is_alive():
+            self.root.after(SEARCH_POLL_MS, self._poll_search, thread, result, generation)
+        elif generation == self._search_generation:
+            self._show_search_results(result["ids"], result["elapsed"])
+
+    def _show_search_results(self, ids, elapsed):
+        """Afișează rezultatele prin lista virtuală (None înseamnă tot catalogul)."""
+        start = time.perf_counter()
+        if not self.virtual:
+            if ids is None:
+                return  # Lista completă este deja afișată
+            # Filtrarea folosește mereu lista virtuală, chiar și pentru cataloage mici
+            self._enable_virtual_view()
+        if ids is None:
+            self.view_ids = list(self.catalog.books)
+        else:
+            # O carte ștearsă cât timp rula căutarea nu mai are ce afișa
+            self.view_ids = [book_id for book_id in ids if book_id in self.catalog]
+        self.view_dead = 0
+        self.view_top = 0
+        self._render_window()
+        self._record_ui_time("căutare", start)
+        if ids is not None:
+            self.status_label.config(
+                text=f"{self.status_label.cget('text')} | {len(self.view_ids)} rezultate, "
+                     f"index: {elapsed * 1000:.2f} ms")
+        self._on_book_select()
 
     def _on_book_select(self, event=None):
         """Activează/dezactivează butoanele Edit/Delete la selectarea unei cărți."""
@@ -246,12 +936,7 @@ class BookManagerApp:
         if not selected_items:
             return None
 
-        selected_item_id = selected_items[0]
-
-        for book in self.books_data:
-            if book["id"] == selected_item_id:
-                return book
-        return None
+        return self.catalog.get(selected_items[0])
 
     def _add_book(self):
         """Deschide fereastra de formular pentru adăugarea unei cărți noi."""
@@ -259,9 +944,10 @@ class BookManagerApp:
 
     def _save_new_book(self, book_data):
         """Adaugă o carte nouă în listă și salvează."""
-        self.books_data.append(book_data)
-        self._save_books()
-        self._refresh_book_list()
+        self.catalog.add(book_data)
+        self.search_index.add(book_data)
+        self._save_change("add", book_data)
+        self._insert_row(book_data)
         messagebox.showinfo("Succes", f"Cartea '{book_data['title']}' a fost adăugată.", parent=self.root)
 
     def _edit_book(self):
@@ -274,13 +960,10 @@ class BookManagerApp:
 
     def _save_edited_book(self, updated_book_data):
         """Actualizează o carte existentă în listă și salvează."""
-        book_id_to_update = updated_book_data["id"]
-        for i, book in enumerate(self.books_data):
-            if book["id"] == book_id_to_update:
-                self.books_data[i] = updated_book_data
-                break
-        self._save_books()
-        self._refresh_book_list()
+        self.catalog.update(updated_book_data)
+        self.search_index.add(updated_book_data)
+        self._save_change("update", updated_book_data)
+        self._update_row(updated_book_data)
         messagebox.showinfo("Succes", f"Cartea '{updated_book_data['title']}' a fost actualizată.", parent=self.root)
 
     def _delete_book(self):
@@ -296,10 +979,10 @@ class BookManagerApp:
             parent=self.root
         )
         if confirm:
-            book_id_to_delete = selected_book["id"]
-            self.books_data = [book for book in self.books_data if book["id"] != book_id_to_delete]
-            self._save_books()
-            self._refresh_book_list()
+            self.catalog.delete(selected_book["id"])
+            self.search_index.remove(selected_book["id"])
+            self._save_change("delete", selected_book)
+            self._delete_row(selected_book["id"])
             messagebox.showinfo("Succes", f"Cartea '{selected_book['title']}' a fost ștearsă.", parent=self.root)
 
 
@@ -307,7 +990,7 @@ def main():
     """Funcția principală pentru a porni aplicația."""
     root = tk.Tk()
     app = BookManagerApp(root)
-    root.protocol("WM_DELETE_WINDOW", lambda: (app._save_books(), root.destroy()))
+    root.protocol("WM_DELETE_WINDOW", lambda: (app.store.close(), root.destroy()))
     root.mainloop()
 
 
@@ -1,32 +1,193 @@
+import contextlib
+import copy
 import json
 import random
-import copy
 import os
+import sys
+import threading
+import time
+from array import array
+from collections import deque
+
+try:
+    import numpy as np
+except ImportError:  # NumPy este opțional: fără el rest_optim rămâne pe varianta cu cozi
+    np = None
+
+# De la această sumă în sus rest_optim folosește tabelul NumPy
+PRAG_NUMPY = 2048
 
 def citeste_date(filename):
     cale_completa = os.path.join(os.path.dirname(__file__), filename)
     with open(cale_completa, "r") as f:
         return json.load(f)
 
-def rest_optim(valoare, bancnote):
-    max_val = valoare + 1
-    dp = [float('inf')] * max_val
+def calculeaza_strat(dp, val, stoc):
+    # Un strat al rucsacului mărginit: nou[j] = min(dp[j - k * val] + k), 0 <= k <= stoc.
+    # Sumele sunt grupate pe resturi modulo val, iar minimul pe fereastra de stoc + 1
+    # sume vine dintr-o coadă monotonă, deci stratul costă O(len(dp)). alese[j] este k-ul ales.
+    valoare = len(dp) - 1
+    nou = dp[:]
+    alese = array('i', bytes(4 * (valoare + 1)))
+    if stoc > 0:
+        for rest in range(val):
+            coada = deque()
+            for t, suma in enumerate(range(rest, valoare + 1, val)):
+                cost = dp[suma] - t
+                while coada and coada[-1][1] >= cost:
+                    coada.pop()
+                coada.append((t, cost))
+                if coada[0][0] < t - stoc:
+                    coada.popleft()
+                u, cost_minim = coada[0]
+                if cost_minim + t < nou[suma]:
+                    nou[suma] = cost_minim + t
+                    alese[suma] = t - u
+    return nou, alese
+
+def reconstituie_rest(bancnote, alegeri, valoare):
+    rest = {}
+    suma = valoare
+    for b, alese in zip(reversed(bancnote), reversed(alegeri)):
+        k = alese[suma]
+        if k:
+            rest[b["valoare"]] = rest.get(b["valoare"], 0) + k
+            suma -= k * b["valoare"]
+    return rest
+
+def tabel_numpy(valoare, bancnote):
+    # Stocul fiecărei bancnote se împarte binar în pachete de 1, 2, 4, ... bucăți, iar
+    # fiecare pachet este un obiect 0/1: o singură operație np.minimum pe tot tabelul,
+    # deplasat cu valoarea pachetului. Pentru fiecare pachet păstrăm doar masca sumelor
+    # la care a fost luat, de unde se reface soluția.
+    imposibil = valoare + 1
+    dp = np.full(valoare + 1, imposibil, dtype=np.int64)
     dp[0] = 0
-    traseu = [{} for _ in range(max_val)]
-
-    for suma in range(1, max_val):
-        for b in bancnote:
-            val = b["valoare"]
-            stoc = b["stoc"]
-            for k in range(1, stoc + 1):
-                if suma >= k * val and dp[suma - k * val] + k < dp[suma]:
-                    dp[suma] = dp[suma - k * val] + k
-                    traseu[suma] = traseu[suma - k * val].copy()
-                    traseu[suma][val] = traseu[suma].get(val, 0) + k
-
-    if dp[valoare] == float('inf'):
+    pachete = []
+    for b in bancnote:
+        val = b["valoare"]
+        stoc = min(b["stoc"], valoare // val)
+        bucati = 1
+        while stoc > 0:
+            bucati = min(bucati, stoc)
+            deplasare = bucati * val
+            candidat = dp[:-deplasare] + bucati
+            luat = candidat < dp[deplasare:]
+            np.minimum(dp[deplasare:], candidat, out=dp[deplasare:])
+            pachete.append((val, bucati, luat))
+            stoc -= bucati
+            bucati *= 2
+    return dp, pachete
+
+def reconstituie_rest_numpy(pachete, valoare):
+    rest = {}
+    suma = valoare
+    for val, bucati, luat in reversed(pachete):
+        deplasare = bucati * val
+        if suma >= deplasare and luat[suma - deplasare]:
+            rest[val] = rest.get(val, 0) + bucati
+            suma -= deplasare
+    return rest
+
+def rest_optim_numpy(valoare, bancnote):
+    dp, pachete = tabel_numpy(valoare, bancnote)
+    if dp[valoare] > valoare:
         return None
-    return traseu[valoare]
+    return reconstituie_rest_numpy(pachete, valoare)
+
+def rest_optim_lot(valori, bancnote):
+    # Mai multe resturi pentru același stoc: un singur tabel, până la cea mai mare sumă,
+    # din care se reface fiecare soluție (None unde restul nu se poate da)
+    valori = list(valori)
+    if not valori:
+        return []
+    valoare_maxima = max(valori)
+    if np is not None:
+        dp, pachete = tabel_numpy(valoare_maxima, bancnote)
+        return [reconstituie_rest_numpy(pachete, v) if dp[v] <= valoare_maxima else None for v in valori]
+
+    dp = [0] + [valoare_maxima + 1] * valoare_maxima
+    alegeri = []
+    for b in bancnote:
+        dp, alese = calculeaza_strat(dp, b["valoare"], min(b["stoc"], valoare_maxima // b["valoare"]))
+        alegeri.append(alese)
+    return [reconstituie_rest(bancnote, alegeri, v) if dp[v] <= valoare_maxima else None for v in valori]
+
+def rest_optim(valoare, bancnote):
+    if np is not None and valoare >= PRAG_NUMPY:
+        return rest_optim_numpy(valoare, bancnote)
+
+    # Fiecare bancnotă este un strat al DP-ului; pentru fiecare strat păstrăm doar câte
+    # bancnote s-au folosit, iar soluția se reface la final mergând înapoi pe straturi
+    imposibil = valoare + 1
+    dp = [0] + [imposibil] * valoare
+    alegeri = []
+
+    for b in bancnote:
+        dp, alese = calculeaza_strat(dp, b["valoare"], min(b["stoc"], valoare // b["valoare"]))
+        alegeri.append(alese)
+
+    if dp[valoare] >= imposibil:
+        return None
+    return reconstituie_rest(bancnote, alegeri, valoare)
+
+class RezolvitorRest:
+    # Păstrează straturile DP pentru toate sumele până la suma_maxima și stocul cu care
+    # a fost calculat fiecare strat. La o cerere se recalculează doar straturile de la
+    # prima bancnotă al cărei stoc efectiv (plafonat la suma_maxima // valoare) s-a
+    # schimbat; răspunsurile sunt păstrate într-un cache după (vectorul de stoc, sumă).
+    def __init__(self, bancnote, suma_maxima=0, dimensiune_cache=4096):
+        self.bancnote = bancnote
+        self.suma_maxima = suma_maxima
+        self.dimensiune_cache = dimensiune_cache
+        self.cache = {}
+        self.straturi = []
+        self.alegeri = []
+        self.stocuri = []
+        self.straturi_recalculate = 0
+
+    def _stoc_efectiv(self, b):
+        return min(b["stoc"], self.suma_maxima // b["valoare"])
+
+    def _actualizeaza_straturi(self):
+        primul = len(self.stocuri)
+        for i, stoc in enumerate(self.stocuri):
+            if stoc != self._stoc_efectiv(self.bancnote[i]):
+                primul = i
+                break
+        del self.straturi[primul:], self.alegeri[primul:], self.stocuri[primul:]
+
+        dp = self.straturi[-1] if self.straturi else [0] + [self.suma_maxima + 1] * self.suma_maxima
+        for b in self.bancnote[primul:]:
+            stoc = self._stoc_efectiv(b)
+            dp, alese = calculeaza_strat(dp, b["valoare"], stoc)
+            self.straturi.append(dp)
+            self.alegeri.append(alese)
+            self.stocuri.append(stoc)
+            self.straturi_recalculate += 1
+
+    def rest(self, valoare):
+        cheie = (tuple(b["stoc"] for b in self.bancnote), valoare)
+        if cheie in self.cache:
+            solutie = self.cache[cheie]
+            return None if solutie is None else dict(solutie)
+
+        if valoare > self.suma_maxima:
+            # Suma nouă nu încape în tabel: îl refacem pentru noua sumă maximă
+            self.suma_maxima = valoare
+            self.straturi, self.alegeri, self.stocuri = [], [], []
+        self._actualizeaza_straturi()
+
+        dp = self.straturi[-1] if self.straturi else [0] + [self.suma_maxima + 1] * self.suma_maxima
+        if dp[valoare] > self.suma_maxima:
+            solutie = None
+        else:
+            solutie = reconstituie_rest(self.bancnote, self.alegeri, valoare)
+
+        if len(self.cache) >= self.dimensiune_cache:
+            del self.cache[next(iter(self.cache))]
+        self.cache[cheie] = solutie
+        return None if solutie is None else dict(solutie)
 
 def actualizeaza_stoc(stoc, rest):
     for val, nr in rest.items():
@@ -34,34 +195,130 @@ def actualizeaza_stoc(stoc, rest):
             if b["valoare"] == val:
                 b["stoc"] -= nr
 
-def simuleaza():
+def simuleaza(afiseaza=True, numar_maxim_tranzactii=None):
     data = citeste_date("date.json")
     bancnote = data["bancnote"]
     produse = data["produse"]
+    rezolvitor = RezolvitorRest(bancnote, suma_maxima=20)
+    tranzactii = 0
 
-    while True:
+    while numar_maxim_tranzactii is None or tranzactii < numar_maxim_tranzactii:
         produs = random.choice(produse)
         pret = produs["pret"]
         plata = random.randint(pret + 1, pret + 20)
         rest_de_dat = plata - pret
 
-        print(f"\nProdus cumpărat: {produs['nume']}")
-        print(f"Preț: {pret} lei")
-        print(f"Suma plătită: {plata} lei")
-        print(f"Rest de dat: {rest_de_dat} lei")
+        if afiseaza:
+            print(f"\nProdus cumpărat: {produs['nume']}")
+            print(f"Preț: {pret} lei")
+            print(f"Suma plătită: {plata} lei")
+            print(f"Rest de dat: {rest_de_dat} lei")
 
-        solutie = rest_optim(rest_de_dat, copy.deepcopy(bancnote))
+        solutie = rezolvitor.rest(rest_de_dat)
 
         if solutie is None:
-            print("\n❌ Nu se poate oferi restul! Simularea se oprește.")
-            print("Stoc bancnote insuficient pentru rest optim.")
+            if afiseaza:
+                print("\n❌ Nu se poate oferi restul! Simularea se oprește.")
+                print("Stoc bancnote insuficient pentru rest optim.")
             break
 
-        print("Rest oferit:")
-        for val, nr in sorted(solutie.items(), reverse=True):
-            print(f"  {nr} x {val} lei")
+        if afiseaza:
+            print("Rest oferit:")
+            for val, nr in sorted(solutie.items(), reverse=True):
+                print(f"  {nr} x {val} lei")
 
         actualizeaza_stoc(bancnote, solutie)
+        tranzactii += 1
+
+    return tranzactii
+
+def percentila(valori_sortate, procent):
+    return valori_sortate[min(len(valori_sortate) - 1, int(len(valori_sortate) * procent / 100))]
+
+def simuleaza_terminale(numar_terminale=4, stoc_partajat=True, tranzactii_per_terminal=None, samanta=None,
+                        fisier="date.json"):
+    # Mai multe terminale virtuale, fiecare pe firul lui de execuție. Cu stoc_partajat toate
+    # folosesc același stoc și același RezolvitorRest, protejate de un lacăt; altfel fiecare
+    # terminal are copia lui de stoc. Produsele se aleg după "pondere" (implicit 1), iar
+    # restul este între plata["adaos_minim"] și plata["adaos_maxim"] lei (implicit 1 și 20,
+    # ca în simuleaza). Un terminal se oprește la primul rest care nu mai poate fi dat
+    # (momentul epuizării) sau după tranzactii_per_terminal vânzări. În loc să afișeze
+    # fiecare vânzare, întoarce debitul, latențele calculului de rest și timpii de epuizare.
+    data = citeste_date(fisier)
+    produse = data["produse"]
+    ponderi = [p.get("pondere", 1) for p in produse]
+    plata = data.get("plata", {})
+    adaos_minim = plata.get("adaos_minim", 1)
+    adaos_maxim = plata.get("adaos_maxim", 20)
+
+    if stoc_partajat:
+        rezolvitoare = [RezolvitorRest(data["bancnote"], suma_maxima=adaos_maxim)] * numar_terminale
+        lacat = threading.Lock()
+    else:
+        rezolvitoare = [RezolvitorRest(copy.deepcopy(data["bancnote"]), suma_maxima=adaos_maxim)
+                        for _ in range(numar_terminale)]
+        lacat = contextlib.nullcontext()
+
+    tranzactii = [0] * numar_terminale
+    incasari = [0] * numar_terminale
+    latente = [[] for _ in range(numar_terminale)]
+    epuizare = [None] * numar_terminale
+
+    def terminal(i):
+        rng = random.Random(None if samanta is None else samanta + i)
+        rezolvitor = rezolvitoare[i]
+        while tranzactii_per_terminal is None or tranzactii[i] < tranzactii_per_terminal:
+            produs = rng.choices(produse, ponderi)[0]
+            rest_de_dat = rng.randint(adaos_minim, adaos_maxim)
+
+            with lacat:
+                t0 = time.perf_counter_ns()
+                solutie = rezolvitor.rest(rest_de_dat)
+                if solutie is not None:
+                    actualizeaza_stoc(rezolvitor.bancnote, solutie)
+                latente[i].append(time.perf_counter_ns() - t0)
+
+            if solutie is None:
+                epuizare[i] = time.perf_counter() - inceput
+                return
+            tranzactii[i] += 1
+            incasari[i] += produs["pret"]
+
+    fire = [threading.Thread(target=terminal, args=(i,)) for i in range(numar_terminale)]
+    inceput = time.perf_counter()
+    for fir in fire:
+        fir.start()
+    for fir in fire:
+        fir.join()
+    durata = time.perf_counter() - inceput
+
+    toate_latentele = sorted(latenta for lista in latente for latenta in lista)
+    timpi_epuizare = sorted(timp for timp in epuizare if timp is not None)
+    total = sum(tranzactii)
+    return {
+        'terminale': numar_terminale,
+        'stoc_partajat': stoc_partajat,
+        'tranzactii': total,
+        'incasari': sum(incasari),
+        'durata': durata,
+        'tranzactii_pe_secunda': total / durata if durata > 0 else 0.0,
+        'latenta_p50_ns': percentila(toate_latentele, 50) if toate_latentele else None,
+        'latenta_p95_ns': percentila(toate_latentele, 95) if toate_latentele else None,
+        'latenta_p99_ns': percentila(toate_latentele, 99) if toate_latentele else None,
+        'latenta_maxima_ns': toate_latentele[-1] if toate_latentele else None,
+        'terminale_epuizate': len(timpi_epuizare),
+        'timp_epuizare_minim': timpi_epuizare[0] if timpi_epuizare else None,
+        'timp_epuizare_median': percentila(timpi_epuizare, 50) if timpi_epuizare else None,
+        'timp_epuizare_maxim': timpi_epuizare[-1] if timpi_epuizare else None,
+        'tranzactii_pana_la_epuizare': [tranzactii[i] if epuizare[i] is not None else None
+                                        for i in range(numar_terminale)],
+    }
 
-if __name__ == "__main__":
+if __name__ == "__main__" and sys.argv[1:2] == ["terminale"]:
+    # python laboratortema3.py terminale [numar_terminale] [partajat|separat]
+    raport = simuleaza_terminale(int(sys.argv[2]) if len(sys.argv) > 2 else 4,
+                                 stoc_partajat=sys.argv[3:4] != ["separat"])
+    for cheie, valoare in raport.items():
+        print(f"{cheie}: {valoare}")
+elif __name__ == "__main__":
     simuleaza()
\ No newline at end of file